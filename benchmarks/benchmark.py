@@ -0,0 +1,339 @@
+"""Benchmark MonitorDevice against a simulated BetterDisplay server.
+
+Usage:
+    python benchmarks/benchmark.py --hosts 2 --displays 3 --cycles 50 \
+        --latency 20 --jitter 10 --failure-rate 0.01 --output report.json
+
+The report also compares the DisplayState snapshot with the plain dicts it
+replaced (--snapshots displays, in-process only).
+
+The simulated servers run in a separate thread so that the event loop time
+reported per cycle only covers the integration itself.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+
+from aiohttp import web
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+# Home Assistant normally loads these before the integration
+import homeassistant.components.persistent_notification  # noqa: E402,F401
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from custom_components.hass_better_display.const import DOMAIN  # noqa: E402
+from custom_components.hass_better_display.device import MonitorDevice  # noqa: E402
+from custom_components.hass_better_display.state import DisplayState  # noqa: E402
+
+
+class SimulatedServer:
+    """Emulate the /get and /set endpoints of the BetterDisplay HTTP server."""
+
+    def __init__(
+        self,
+        displays: list[str],
+        latency: float,
+        jitter: float,
+        failure_rate: float,
+        batch: bool = True,
+    ) -> None:
+        self.state = {
+            name: {"brightness": "0.5", "volume": "0.5", "mute": "off", "inputSelect": "15"}
+            for name in displays
+        }
+        self.latency = latency / 1000
+        self.jitter = jitter / 1000
+        self.failure_rate = failure_rate
+        self.batch = batch
+        self.requests = 0
+        # 整个运行期间出现过的客户端地址，即曾经建立过的连接数
+        self.peers: set[tuple] = set()
+        self._runner: web.AppRunner | None = None
+        self.port: int | None = None
+
+    @property
+    def live_connections(self) -> int:
+        """Return the number of connections currently open to this server."""
+        return len(self._runner.server.connections) if self._runner else 0
+
+    async def _delay(self, request: web.Request) -> bool:
+        self.requests += 1
+        self.peers.add(request.transport.get_extra_info("peername"))
+        delay = self.latency + random.uniform(-self.jitter, self.jitter)
+        await asyncio.sleep(max(delay, 0))
+        return random.random() >= self.failure_rate
+
+    async def handle_root(self, request: web.Request) -> web.Response:
+        await self._delay(request)
+        return web.Response(text="BetterDisplay")
+
+    async def handle_get(self, request: web.Request) -> web.Response:
+        if not await self._delay(request):
+            return web.Response(status=503)
+        query = request.query
+        if "identifiers" in query:
+            return web.Response(
+                text=",".join(json.dumps({"name": name}) for name in self.state)
+            )
+        if (display := self.state.get(query.get("name", ""))) is None:
+            return web.Response(status=404)
+        if self.batch and query.get("format") == "json":
+            features = query.get("feature", "").split(",")
+            return web.json_response(
+                {feature: display[feature] for feature in features if feature in display}
+            )
+        key = query.get("vcp") if query.get("feature") == "ddc" else query.get("feature")
+        if key not in display:
+            return web.Response(status=404)
+        return web.Response(text=display[key])
+
+    async def handle_set(self, request: web.Request) -> web.Response:
+        if not await self._delay(request):
+            return web.Response(status=503)
+        query = request.query
+        if (display := self.state.get(query.get("name", ""))) is None:
+            return web.Response(status=404)
+        if query.get("vcp") == "inputSelect":
+            display["inputSelect"] = query.get("ddc", "")
+        elif query.get("feature") in display:
+            display[query["feature"]] = query.get("value", "")
+        else:
+            return web.Response(status=404)
+        return web.Response(text="OK")
+
+    async def async_start(self) -> None:
+        app = web.Application()
+        app.router.add_get("/", self.handle_root)
+        app.router.add_get("/get", self.handle_get)
+        app.router.add_get("/set", self.handle_set)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+
+
+def start_servers(servers: list[SimulatedServer]) -> None:
+    """Run the simulated servers on their own event loop thread."""
+    loop = asyncio.new_event_loop()
+    started = threading.Event()
+
+    def run() -> None:
+        asyncio.set_event_loop(loop)
+        for server in servers:
+            loop.run_until_complete(server.async_start())
+        started.set()
+        loop.run_forever()
+
+    threading.Thread(target=run, daemon=True).start()
+    started.wait()
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Return the nearest-rank percentile of values."""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _build_dicts(count: int, now: float) -> list[tuple[dict, dict]]:
+    """Apply one refresh to the state and fetch time dicts used before DisplayState."""
+    state = {"brightness": 0.5, "volume": 0.5, "source": "15", "mute_state": "off"}
+    fetched = {"brightness": None, "volume": None, "mute": None, "source": None}
+    values = {"brightness": 0.6, "volume": 0.4, "mute_state": "on"}
+    times = {"brightness": now, "volume": now, "mute": now}
+    return [({**state, **values}, {**fetched, **times}) for _ in range(count)]
+
+
+def _build_snapshots(count: int, now: float) -> list[DisplayState]:
+    """Apply one refresh to a DisplayState per display."""
+    state = DisplayState(0.5, 0.5, "off", "15")
+    changes = {
+        "brightness": 0.6,
+        "volume": 0.4,
+        "mute_state": "on",
+        "brightness_fetched_at": now,
+        "volume_fetched_at": now,
+        "mute_fetched_at": now,
+    }
+    return [state.updated(changes) for _ in range(count)]
+
+
+def _measure(build, read, count: int, rounds: int) -> dict:
+    """Return memory per display and build and read times per display."""
+    tracemalloc.start()
+    items = build(count, time.monotonic())
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        items = build(count, time.monotonic())
+    build_ns = (time.perf_counter() - start) / rounds / count * 1e9
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        read(items)
+    read_ns = (time.perf_counter() - start) / rounds / count * 1e9
+    return {
+        "bytes_per_display": round(size / count, 1),
+        "build_ns_per_display": round(build_ns, 1),
+        "read_ns_per_display": round(read_ns, 1),
+    }
+
+
+def snapshot_benchmark(count: int, rounds: int = 20) -> dict:
+    """Compare allocation and attribute access of the two state layouts."""
+
+    def read_dicts(items: list[tuple[dict, dict]]) -> None:
+        for state, _ in items:
+            state["brightness"], state["volume"], state["source"], state["mute_state"]
+
+    def read_snapshots(items: list[DisplayState]) -> None:
+        for state in items:
+            state.brightness, state.volume, state.source, state.mute_state
+
+    return {
+        "displays": count,
+        "dict": _measure(_build_dicts, read_dicts, count, rounds),
+        "snapshot": _measure(_build_snapshots, read_snapshots, count, rounds),
+    }
+
+
+async def async_run(args: argparse.Namespace) -> dict:
+    """Run the benchmark and return the report."""
+    servers = [
+        SimulatedServer(
+            [f"Display {host}-{index}" for index in range(args.displays)],
+            args.latency,
+            args.jitter,
+            args.failure_rate,
+            not args.no_batch,
+        )
+        for host in range(args.hosts)
+    ]
+    start_servers(servers)
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        hass.data[DOMAIN] = {}
+        devices = [
+            MonitorDevice(hass, name, f"http://127.0.0.1:{server.port}")
+            for server in servers
+            for name in server.state
+        ]
+        hubs = list({id(device.hub): device.hub for device in devices}.values())
+
+        refresh_ms: list[float] = []
+        loop_ms: list[float] = []
+        live_connections: list[int] = []
+        requests_before = sum(server.requests for server in servers)
+        for _ in range(args.cycles):
+            start = time.perf_counter()
+            cpu_start = time.thread_time()
+            await asyncio.gather(*(hub.coordinator.async_refresh() for hub in hubs))
+            loop_ms.append((time.thread_time() - cpu_start) * 1000)
+            refresh_ms.append((time.perf_counter() - start) * 1000)
+            # 每轮结束时仍保持打开的连接，而不是运行期间累计建立过的连接
+            live_connections.append(sum(server.live_connections for server in servers))
+        refresh_requests = sum(server.requests for server in servers) - requests_before
+
+        # 模拟拖动滑块：每个显示器连续发送多次亮度和音量
+        requests_before = sum(server.requests for server in servers)
+        start = time.perf_counter()
+        for step in range(args.ticks):
+            value = round(step / max(args.ticks - 1, 1), 2)
+            for device in devices:
+                await device.async_set_brightness(value)
+                await device.async_set_volume(value)
+            await asyncio.sleep(0)
+        await asyncio.sleep(devices[0].verify_delay + 0.5 if devices else 0)
+        await hass.async_block_till_done()
+        write_ms = (time.perf_counter() - start) * 1000
+        write_requests = sum(server.requests for server in servers) - requests_before
+
+        client_metrics: dict[str, int] = {}
+        for hub in hubs:
+            for key, value in hub.client.metrics.items():
+                client_metrics[key] = client_metrics.get(key, 0) + value
+
+        scheduler = hubs[0].scheduler.as_dict() if hubs else {}
+
+        for device in devices:
+            await device.async_close()
+        await hass.async_stop(force=True)
+
+    manifest = json.loads(
+        (ROOT / "custom_components" / DOMAIN / "manifest.json").read_text()
+    )
+    return {
+        "version": manifest["version"],
+        "config": vars(args),
+        "refresh": {
+            "cycles": args.cycles,
+            "p50_ms": round(percentile(refresh_ms, 50), 2),
+            "p99_ms": round(percentile(refresh_ms, 99), 2),
+            "mean_ms": round(statistics.fmean(refresh_ms), 2),
+            "requests_per_refresh": round(refresh_requests / args.cycles, 2),
+            "loop_cpu_ms_per_cycle": round(statistics.fmean(loop_ms), 3),
+        },
+        "writes": {
+            "slider_ticks": args.ticks * len(devices) * 2,
+            "requests": write_requests,
+            "duration_ms": round(write_ms, 2),
+        },
+        "scheduler": {
+            "max_queue_depth": scheduler.get("max_queue_depth"),
+            "lag_p99_ms": scheduler.get("lag", {}).get("p99_ms"),
+            "lag_max_ms": scheduler.get("lag", {}).get("max_ms"),
+        },
+        "sockets": {
+            "live_connections": live_connections[-1] if live_connections else 0,
+            "live_connections_max": max(live_connections, default=0),
+            "distinct_connections": sum(len(server.peers) for server in servers),
+            **client_metrics,
+        },
+        "state": snapshot_benchmark(args.snapshots),
+    }
+
+
+def main() -> None:
+    """Parse arguments, run the benchmark and write the JSON report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hosts", type=int, default=1)
+    parser.add_argument("--displays", type=int, default=3, help="displays per host")
+    parser.add_argument("--cycles", type=int, default=50)
+    parser.add_argument("--ticks", type=int, default=20, help="slider ticks per display")
+    parser.add_argument("--latency", type=float, default=20, help="ms per request")
+    parser.add_argument("--jitter", type=float, default=5, help="ms of random jitter")
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--no-batch", action="store_true", help="emulate a server without batched reads"
+    )
+    parser.add_argument(
+        "--snapshots", type=int, default=10000, help="displays in the state benchmark"
+    )
+    parser.add_argument("--output", type=Path, help="write the JSON report here")
+    args = parser.parse_args()
+
+    report = asyncio.run(async_run(args))
+    text = json.dumps(report, indent=2, default=str)
+    if args.output:
+        args.output.write_text(text)
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
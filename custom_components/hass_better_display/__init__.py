@@ -2,38 +2,71 @@
 from __future__ import annotations
 import logging
 
+from homeassistant.components import webhook
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN, CONF_BASE_URL, CONF_DEVICE_NAME
+from .const import (
+    DOMAIN,
+    CONF_BASE_URL,
+    CONF_DEVICE_NAME,
+    CONF_SUPPORTED_SOURCES,
+    CONF_WEBHOOK_ID,
+    DATA_STORE,
+)
 from .device import MonitorDevice
+from .push import async_register_push
+from .services import async_setup_services
+from .store import async_setup_store
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 
 PLATFORMS: list[str] = [
     Platform.LIGHT,
     Platform.FAN,
     Platform.SELECT,
+    Platform.SENSOR,
 ]
 
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Monitor Control services."""
+    hass.data.setdefault(DOMAIN, {})
+    await async_setup_store(hass)
+    async_setup_services(hass)
+    return True
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Monitor Control from a config entry."""
     hass.data.setdefault(DOMAIN, {})
-    
+
+    if CONF_WEBHOOK_ID not in entry.data:
+        hass.config_entries.async_update_entry(
+            entry, data={**entry.data, CONF_WEBHOOK_ID: webhook.async_generate_id()}
+        )
+
     device = MonitorDevice(
         hass,
         entry.data[CONF_DEVICE_NAME],
         entry.data[CONF_BASE_URL],
+        entry.options,
+        entry.data.get(CONF_SUPPORTED_SOURCES),
     )
     
     hass.data[DOMAIN][entry.entry_id] = device
+    entry.async_on_unload(async_register_push(hass, entry, device))
 
+    # 所有平台共享同一次首次刷新
+    await device.hub.async_first_refresh(device)
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     # 监听配置变更
     async def config_update(hass, entry):
-        old_device = hass.data[DOMAIN][entry.entry_id]
-        await old_device.update_config(entry)
+        # 主机或名称变化时设备原地迁移，实体通过信号更新，不重新加载条目
+        await hass.data[DOMAIN][entry.entry_id].update_config(entry)
         
     # 注册更新监听器
     entry.async_on_unload(
@@ -42,3 +75,18 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     return True
 
+
+
+async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Unload a config entry."""
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok:
+        device = hass.data[DOMAIN].pop(entry.entry_id)
+        await device.async_close()
+    return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Forget the saved state of a removed display."""
+    if (store := hass.data.get(DOMAIN, {}).get(DATA_STORE)) is not None:
+        store.async_remove(f"{DOMAIN}_{entry.data[CONF_DEVICE_NAME]}")
@@ -0,0 +1,71 @@
+"""Circuit breaker for unreachable BetterDisplay hosts."""
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from homeassistant.core import callback
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+
+
+class CircuitBreaker:
+    """Open after repeated failed refreshes and close on the next answer."""
+
+    def __init__(self, threshold: int) -> None:
+        """Initialize the breaker."""
+        self.threshold = threshold
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.trips = 0
+        self.opened_at: float | None = None
+        self.rejected = 0
+        # 一次刷新会并发发出多个请求，同一轮内只计一次失败
+        self._round_failed = False
+
+    @property
+    def is_open(self) -> bool:
+        """Return True while requests should be rejected."""
+        return self.state == STATE_OPEN
+
+    @callback
+    def async_success(self) -> bool:
+        """Record an answer from the host, returning True if the breaker closed."""
+        self.failures = 0
+        if self.state == STATE_CLOSED:
+            return False
+        self.state = STATE_CLOSED
+        self.opened_at = None
+        return True
+
+    @callback
+    def async_next_round(self) -> None:
+        """Start a new refresh round."""
+        self._round_failed = False
+
+    @callback
+    def async_failure(self) -> bool:
+        """Record a connection failure, returning True if the breaker opened."""
+        if self._round_failed:
+            return False
+        self._round_failed = True
+        self.failures += 1
+        if self.state == STATE_OPEN or self.failures < self.threshold:
+            return False
+        self.state = STATE_OPEN
+        self.opened_at = time.monotonic()
+        self.trips += 1
+        return True
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the breaker state for diagnostics."""
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "trips": self.trips,
+            "rejected_requests": self.rejected,
+            "open_for": (
+                None if self.opened_at is None else round(time.monotonic() - self.opened_at, 1)
+            ),
+        }
@@ -0,0 +1,203 @@
+"""HTTP client for the BetterDisplay integration server."""
+from __future__ import annotations
+
+import asyncio
+import re
+import time
+from collections.abc import Callable
+from typing import Any
+
+import aiohttp
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import (
+    async_create_clientsession,
+    async_get_clientsession,
+)
+
+from .breaker import CircuitBreaker
+from .const import (
+    BREAKER_THRESHOLD,
+    CAPABILITIES_QUERY,
+    CONNECT_TIMEOUT,
+    FEATURE_TIMEOUT,
+    PROBE_TIMEOUT,
+    REQUEST_TIMEOUT,
+)
+from .stats import RequestTimings
+
+# MCCS 能力字符串中 VCP 60（inputSelect）的取值列表，例如 60(0F 11 12)
+_INPUT_SELECT_RE = re.compile(r"(?<![0-9A-Fa-f])60\s*\(([0-9A-Fa-f\s]*)\)")
+
+
+class HostUnavailableError(ConnectionError):
+    """The circuit breaker of the host is open."""
+
+
+class BetterDisplayClient:
+    """Keep-alive HTTP client shared by all displays of one BetterDisplay host."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        base_url: str,
+        on_breaker_change: Callable[[], None] | None = None,
+    ) -> None:
+        """Initialize the client."""
+        self.base_url = base_url
+        self.breaker = CircuitBreaker(BREAKER_THRESHOLD)
+        self._on_breaker_change = on_breaker_change
+        self.metrics: dict[str, int] = {
+            "requests": 0,
+            "errors": 0,
+            "connections_created": 0,
+            "connections_reused": 0,
+            "bytes_received": 0,
+        }
+        self.timings = RequestTimings()
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_create_end.append(self._on_connection_create)
+        trace_config.on_connection_reuseconn.append(self._on_connection_reuse)
+
+        # 基于 HA 共享的连接池创建会话，同一主机的请求复用 keep-alive 连接
+        self._session = async_create_clientsession(
+            hass,
+            auto_cleanup=False,
+            timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT, connect=CONNECT_TIMEOUT),
+            trace_configs=[trace_config],
+        )
+        self._unsub_close = hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_CLOSE, self._async_on_hass_close
+        )
+
+    async def _on_connection_create(self, session, context, params) -> None:
+        self.metrics["connections_created"] += 1
+
+    async def _on_connection_reuse(self, session, context, params) -> None:
+        self.metrics["connections_reused"] += 1
+
+    @callback
+    def _async_breaker_changed(self) -> None:
+        if self._on_breaker_change is not None:
+            self._on_breaker_change()
+
+    async def _async_request(
+        self, path: str, params: dict[str, Any], timeout: float | None = None
+    ) -> tuple[int, str]:
+        """Send a request and return the status and body."""
+        feature = f"{path[1:]}:{params.get('vcp') or params.get('feature') or next(iter(params), '')}"
+        if self.breaker.is_open:
+            # 主机不可达时直接拒绝，不等待超时
+            self.breaker.rejected += 1
+            self.timings.add_request(feature, "rejected", 0)
+            raise HostUnavailableError(f"{self.base_url} is unreachable")
+
+        self.metrics["requests"] += 1
+        kwargs = (
+            {}
+            if timeout is None
+            else {"timeout": aiohttp.ClientTimeout(total=timeout, connect=CONNECT_TIMEOUT)}
+        )
+        start = time.perf_counter()
+        outcome = "error"
+        try:
+            async with self._session.get(
+                f"{self.base_url}{path}", params=params, **kwargs
+            ) as resp:
+                body = await resp.read()
+                outcome = "ok" if resp.status == 200 else f"http_{resp.status}"
+                result = resp.status, body.decode(resp.get_encoding(), "replace")
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as err:
+            self.metrics["errors"] += 1
+            outcome = "timeout" if isinstance(err, asyncio.TimeoutError) else "connection_error"
+            # 单个功能读取超时只说明 DDC 慢，连接失败（含连接超时）才说明主机不可达
+            if (
+                timeout is None or isinstance(err, aiohttp.ClientConnectionError)
+            ) and self.breaker.async_failure():
+                self._async_breaker_changed()
+            raise
+        except Exception:
+            self.metrics["errors"] += 1
+            raise
+        finally:
+            self.timings.add_request(feature, outcome, (time.perf_counter() - start) * 1000)
+        self.metrics["bytes_received"] += len(body)
+        if self.breaker.async_success():
+            self._async_breaker_changed()
+        return result
+
+    async def async_get(
+        self, params: dict[str, Any], timeout: float | None = None
+    ) -> str | None:
+        """Read a value, returning None when the server does not answer 200."""
+        status, text = await self._async_request("/get", params, timeout)
+        if status != 200:
+            return None
+        return text
+
+    async def async_set(self, params: dict[str, Any]) -> bool:
+        """Write a value, returning whether the server accepted it."""
+        status, _ = await self._async_request("/set", params)
+        return status == 200
+
+    async def async_probe(self) -> bool:
+        """Check with a cheap request whether the host answers at all."""
+        try:
+            async with self._session.get(
+                self.base_url, timeout=aiohttp.ClientTimeout(total=PROBE_TIMEOUT)
+            ):
+                pass
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return False
+        if self.breaker.async_success():
+            self._async_breaker_changed()
+        return True
+
+    @callback
+    def async_set_base_url(self, base_url: str) -> None:
+        """Send further requests to another host, keeping the session."""
+        self.base_url = base_url
+        # 新主机的可达性未知，从关闭状态重新开始计数
+        if self.breaker.async_success():
+            self._async_breaker_changed()
+
+    @callback
+    def _async_on_hass_close(self, event: Event) -> None:
+        self._unsub_close = None
+        self._session.detach()
+
+    @callback
+    def async_close(self) -> None:
+        """Release the session back to Home Assistant."""
+        if self._unsub_close is not None:
+            self._unsub_close()
+            self._unsub_close = None
+            self._session.detach()
+
+
+def parse_input_sources(capabilities: str) -> list[str]:
+    """Return the inputSelect codes of a DDC capabilities string as decimal strings."""
+    if (match := _INPUT_SELECT_RE.search(capabilities)) is None:
+        return []
+    return [str(int(code, 16)) for code in match.group(1).split()]
+
+
+async def async_read_input_sources(
+    hass: HomeAssistant, base_url: str, name: str
+) -> list[str] | None:
+    """Read the input sources a display supports, None when they are unknown."""
+    session = async_get_clientsession(hass)
+    try:
+        async with session.get(
+            f"{base_url.rstrip('/')}/get",
+            params={**CAPABILITIES_QUERY, "name": name},
+            timeout=aiohttp.ClientTimeout(total=FEATURE_TIMEOUT),
+        ) as resp:
+            if resp.status != 200:
+                return None
+            text = await resp.text()
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+        return None
+    return parse_input_sources(text) or None
@@ -5,14 +5,62 @@ import logging
 from typing import Any
 import voluptuous as vol
 from homeassistant import config_entries
+from homeassistant.components import webhook
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import config_validation as cv
 
-from .const import DOMAIN, CONF_BASE_URL, CONF_DEVICE_NAME, CONF_SOURCE_LIST, DEFAULT_NAME
+from .client import async_read_input_sources
+from .const import (
+    DOMAIN,
+    CONF_ALLOW_UNSUPPORTED,
+    CONF_BASE_URL,
+    CONF_DEVICE_NAME,
+    CONF_MAX_INTERVAL,
+    CONF_MIN_INTERVAL,
+    CONF_PUSH,
+    CONF_SOFTWARE_TTL,
+    CONF_SOURCE_LIST,
+    CONF_SOURCE_TTL,
+    CONF_SUPPORTED_SOURCES,
+    CONF_VERIFY_DELAY,
+    CONF_WEBHOOK_ID,
+    DEFAULT_MAX_INTERVAL,
+    DEFAULT_MIN_INTERVAL,
+    DEFAULT_NAME,
+    DEFAULT_SOFTWARE_TTL,
+    DEFAULT_SOURCE_TTL,
+    DEFAULT_VERIFY_DELAY,
+)
+from .device import parse_source
 
 _LOGGER = logging.getLogger(__name__)
 
+
+def _parse_source_list(text: str) -> dict[str, str]:
+    """解析 "key:code,..." 格式的输入源列表，编码统一为十进制，格式错误时抛出 ValueError."""
+    source_list = {}
+    for item in text.split(','):
+        key, value = item.strip().split(':')
+        # 0x11、017 和 17 都表示同一个输入源
+        source_list[key.strip()] = parse_source(value)
+    return source_list
+
+
+def _unsupported_sources(
+    source_list: dict[str, str], supported: list[str] | None
+) -> list[str]:
+    """返回显示器不支持的输入源名称，能力未知时不做检查."""
+    if not supported:
+        return []
+    return [key for key, value in source_list.items() if value not in supported]
+
+
+def _sources_placeholder(supported: list[str] | None) -> str:
+    """在错误提示中列出显示器支持的输入源编码."""
+    return ", ".join(supported) if supported else "-"
+
+
 class MonitorControlConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Monitor Control."""
 
@@ -23,25 +71,34 @@ class MonitorControlConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     ) -> FlowResult:
         """Handle the initial step."""
         errors = {}
+        supported: list[str] | None = None
 
         if user_input is not None:
             # 验证输入源列表格式
             try:
-                source_list = {}
-                for item in user_input[CONF_SOURCE_LIST].split(','):
-                    key, value = item.strip().split(':')
-                    source_list[key.strip()] = value.strip()
-                
-                return self.async_create_entry(
-                    title=user_input[CONF_DEVICE_NAME],
-                    data={
-                        CONF_DEVICE_NAME: user_input[CONF_DEVICE_NAME],
-                        CONF_BASE_URL: user_input[CONF_BASE_URL],
-                        CONF_SOURCE_LIST: source_list,
-                    },
-                )
+                source_list = _parse_source_list(user_input[CONF_SOURCE_LIST])
             except ValueError:
                 errors["base"] = "invalid_source_list"
+            else:
+                # 只在配置时读取一次显示器支持的输入源，之后在本地校验
+                supported = await async_read_input_sources(
+                    self.hass, user_input[CONF_BASE_URL], user_input[CONF_DEVICE_NAME]
+                )
+                # 能力字符串经常漏掉实际可用的输入源，用户确认后仍然可以保存
+                if not user_input.get(CONF_ALLOW_UNSUPPORTED) and _unsupported_sources(
+                    source_list, supported
+                ):
+                    errors["base"] = "unsupported_source"
+                else:
+                    return self.async_create_entry(
+                        title=user_input[CONF_DEVICE_NAME],
+                        data={
+                            CONF_DEVICE_NAME: user_input[CONF_DEVICE_NAME],
+                            CONF_BASE_URL: user_input[CONF_BASE_URL],
+                            CONF_SOURCE_LIST: source_list,
+                            CONF_SUPPORTED_SOURCES: supported,
+                        },
+                    )
 
         return self.async_show_form(
             step_id="user",
@@ -53,9 +110,11 @@ class MonitorControlConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         CONF_SOURCE_LIST, 
                         default="hdmi1:15,hdmi2:16,dp:17"
                     ): str,  # 格式: "key1:value1,key2:value2"
+                    vol.Optional(CONF_ALLOW_UNSUPPORTED, default=False): bool,
                 }
             ),
             errors=errors,
+            description_placeholders={"supported": _sources_placeholder(supported)},
         )
 
     @staticmethod
@@ -79,28 +138,55 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
     ) -> FlowResult:
         """处理选项."""
         errors = {}
+        supported = self._config_entry.data.get(CONF_SUPPORTED_SOURCES)
 
-        if user_input is not None:
+        if user_input is not None and user_input[CONF_MAX_INTERVAL] < user_input[CONF_MIN_INTERVAL]:
+            errors["base"] = "invalid_interval"
+        elif user_input is not None:
             try:
                 _LOGGER.info(f"user_input: {user_input}")
-                source_list = {}
-                for item in user_input[CONF_SOURCE_LIST].split(','):
-                    key, value = item.strip().split(':')
-                    source_list[key.strip()] = value.strip()
+                source_list = _parse_source_list(user_input[CONF_SOURCE_LIST])
+            except ValueError:
+                errors["base"] = "invalid_source_list"
+            else:
+                if (
+                    supported is None
+                    or user_input[CONF_BASE_URL] != self._config_entry.data[CONF_BASE_URL]
+                    or user_input[CONF_DEVICE_NAME] != self._config_entry.data[CONF_DEVICE_NAME]
+                ):
+                    # 显示器变了或之前没读到时才重新读取支持的输入源
+                    supported = await async_read_input_sources(
+                        self.hass, user_input[CONF_BASE_URL], user_input[CONF_DEVICE_NAME]
+                    )
+                if not user_input.get(CONF_ALLOW_UNSUPPORTED) and _unsupported_sources(
+                    source_list, supported
+                ):
+                    errors["base"] = "unsupported_source"
 
+            if not errors:
                 # 更新配置条目的数据
                 self.hass.config_entries.async_update_entry(
                     self._config_entry,
                     data={
+                        **self._config_entry.data,
                         CONF_DEVICE_NAME: user_input[CONF_DEVICE_NAME],
                         CONF_BASE_URL: user_input[CONF_BASE_URL],
                         CONF_SOURCE_LIST: source_list,
+                        CONF_SUPPORTED_SOURCES: supported,
                     }
                 )
 
-                return self.async_create_entry(title="", data={})
-            except ValueError:
-                errors["base"] = "invalid_source_list"
+                return self.async_create_entry(
+                    title="",
+                    data={
+                        CONF_VERIFY_DELAY: user_input[CONF_VERIFY_DELAY],
+                        CONF_MIN_INTERVAL: user_input[CONF_MIN_INTERVAL],
+                        CONF_MAX_INTERVAL: user_input[CONF_MAX_INTERVAL],
+                        CONF_PUSH: user_input[CONF_PUSH],
+                        CONF_SOFTWARE_TTL: user_input[CONF_SOFTWARE_TTL],
+                        CONF_SOURCE_TTL: user_input[CONF_SOURCE_TTL],
+                    },
+                )
 
         _LOGGER.info(f"self._config_entry.data: {self._config_entry.data}")
         # 使用当前配置值作为默认值
@@ -126,7 +212,48 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                         CONF_SOURCE_LIST,
                         default=default_source_list
                     ): str,
+                    vol.Optional(
+                        CONF_VERIFY_DELAY,
+                        default=self._config_entry.options.get(
+                            CONF_VERIFY_DELAY, DEFAULT_VERIFY_DELAY
+                        ),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0, max=60)),
+                    vol.Optional(
+                        CONF_MIN_INTERVAL,
+                        default=self._config_entry.options.get(
+                            CONF_MIN_INTERVAL, DEFAULT_MIN_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=3600)),
+                    vol.Optional(
+                        CONF_MAX_INTERVAL,
+                        default=self._config_entry.options.get(
+                            CONF_MAX_INTERVAL, DEFAULT_MAX_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=3600)),
+                    vol.Optional(
+                        CONF_SOFTWARE_TTL,
+                        default=self._config_entry.options.get(
+                            CONF_SOFTWARE_TTL, DEFAULT_SOFTWARE_TTL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
+                    vol.Optional(
+                        CONF_SOURCE_TTL,
+                        default=self._config_entry.options.get(
+                            CONF_SOURCE_TTL, DEFAULT_SOURCE_TTL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=86400)),
+                    vol.Optional(
+                        CONF_PUSH,
+                        default=self._config_entry.options.get(CONF_PUSH, False),
+                    ): bool,
+                    vol.Optional(CONF_ALLOW_UNSUPPORTED, default=False): bool,
                 }
             ),
             errors=errors,
+            description_placeholders={
+                "supported": _sources_placeholder(supported),
+                "webhook_path": webhook.async_generate_path(
+                    self._config_entry.data.get(CONF_WEBHOOK_ID, "")
+                ),
+            },
         ) 
\ No newline at end of file
@@ -4,8 +4,69 @@ DOMAIN = "hass_better_display"
 CONF_BASE_URL = "base_url"
 CONF_DEVICE_NAME = "device_name"
 CONF_SOURCE_LIST = "source_list"
+CONF_VERIFY_DELAY = "verify_delay"
+CONF_MIN_INTERVAL = "min_interval"
+CONF_MAX_INTERVAL = "max_interval"
+CONF_PUSH = "push"
+CONF_SOFTWARE_TTL = "software_ttl"
+CONF_SOURCE_TTL = "source_ttl"
+CONF_WEBHOOK_ID = "webhook_id"
+CONF_SUPPORTED_SOURCES = "supported_sources"
+CONF_ALLOW_UNSUPPORTED = "allow_unsupported"
 
 DEFAULT_NAME = "HASS Better Display"
 
+DATA_HUBS = "hubs"
+DATA_STORE = "store"
+DATA_SCHEDULER = "scheduler"
+
+STORE_VERSION = 1
+STORE_SAVE_DELAY = 30
+
+DEFAULT_MIN_INTERVAL = 10
+DEFAULT_MAX_INTERVAL = 300
+PUSH_SAFETY_INTERVAL = 600
+DEFAULT_SOFTWARE_TTL = 0
+DEFAULT_SOURCE_TTL = 300
+REQUEST_TIMEOUT = 10
+STARTUP_REFRESH_TIMEOUT = 3
+CONNECT_TIMEOUT = 3
+FEATURE_TIMEOUT = 5
+DEFAULT_VERIFY_DELAY = 2
+
+# 渐变每秒最多发送的步数，以及数值的最小变化量
+TRANSITION_MAX_RATE = 4
+TRANSITION_RESOLUTION = 0.01
+
+BREAKER_THRESHOLD = 3
+PROBE_INTERVAL = 15
+PROBE_TIMEOUT = 2
+
+# 所有主机共享的读取并发上限，以及每台主机的上限
+SCHEDULER_CONCURRENCY = 16
+SCHEDULER_HOST_CONCURRENCY = 4
+
+# 每个功能对应的 /get 查询参数
+FEATURE_QUERIES = {
+    "volume": {"feature": "volume"},
+    "mute": {"feature": "mute"},
+    "brightness": {"feature": "brightness"},
+    "source": {"feature": "ddc", "vcp": "inputSelect"},
+}
+# 支持时一次请求读取多个软件功能，返回 JSON 对象
+BATCH_FEATURES = ("brightness", "volume", "mute")
+BATCH_QUERY = {"format": "json"}
+# 显示器的 DDC 能力字符串，其中 60(...) 列出支持的输入源
+CAPABILITIES_QUERY = {"feature": "ddcCapabilities"}
+
 SERVICE_SET_BRIGHTNESS = "set_brightness"
-SERVICE_SET_VOLUME = "set_volume" 
\ No newline at end of file
+SERVICE_SET_VOLUME = "set_volume"
+SERVICE_SET_DISPLAYS = "set_displays"
+
+ATTR_DISPLAYS = "displays"
+ATTR_BRIGHTNESS = "brightness"
+ATTR_VOLUME = "volume"
+ATTR_MUTE = "mute"
+ATTR_SOURCE = "source"
+
+BULK_HOST_CONCURRENCY = 2 
\ No newline at end of file
@@ -1,17 +1,103 @@
 """Monitor control device class."""
+import asyncio
+import json
 import logging
-import aiohttp
-from datetime import timedelta
-import async_timeout
+import math
+import time
+from collections.abc import Iterable, Mapping
+from functools import partial
+from typing import Any
 
-from custom_components.hass_better_display.const import CONF_BASE_URL, CONF_DEVICE_NAME, DOMAIN
+from custom_components.hass_better_display.const import (
+    BATCH_FEATURES,
+    BATCH_QUERY,
+    CONF_BASE_URL,
+    CONF_DEVICE_NAME,
+    DATA_HUBS,
+    DATA_STORE,
+    DOMAIN,
+    FEATURE_QUERIES,
+    FEATURE_TIMEOUT,
+    CONF_MAX_INTERVAL,
+    CONF_MIN_INTERVAL,
+    CONF_PUSH,
+    CONF_SOFTWARE_TTL,
+    CONF_SOURCE_TTL,
+    CONF_SUPPORTED_SOURCES,
+    CONF_VERIFY_DELAY,
+    DEFAULT_MAX_INTERVAL,
+    DEFAULT_MIN_INTERVAL,
+    DEFAULT_SOFTWARE_TTL,
+    DEFAULT_SOURCE_TTL,
+    DEFAULT_VERIFY_DELAY,
+    PUSH_SAFETY_INTERVAL,
+    TRANSITION_MAX_RATE,
+    TRANSITION_RESOLUTION,
+)
+from custom_components.hass_better_display.hub import (
+    BetterDisplayHub,
+    async_get_hub,
+    async_release_hub,
+)
+from custom_components.hass_better_display.singleflight import SingleFlight
+from custom_components.hass_better_display.state import (
+    FEATURE_FIELDS,
+    SOURCE_UNKNOWN,
+    DisplayState,
+)
+from custom_components.hass_better_display.writer import CoalescingWriter, TransitionRamp
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.helpers.device_registry import DeviceInfo
 
 _LOGGER = logging.getLogger(__name__)
 
+_MUTE_VALUES = {
+    "on": "on", "true": "on", "1": "on", "yes": "on",
+    "off": "off", "false": "off", "0": "off", "no": "off",
+}
+
+
+def parse_level(value: str) -> float:
+    """解析亮度或音量，超出 0-1 的值截断到范围内."""
+    level = float(value)
+    if not math.isfinite(level):
+        raise ValueError(f"invalid level {value!r}")
+    return min(max(level, 0.0), 1.0)
+
+
+def parse_mute(value: str) -> str:
+    """解析静音状态为 on 或 off."""
+    if (mute := _MUTE_VALUES.get(value.strip().lower())) is None:
+        raise ValueError(f"invalid mute state {value!r}")
+    return mute
+
+
+def parse_source(value: str) -> str:
+    """解析输入源编码，十六进制（0x0F）转换为十进制字符串."""
+    text = value.strip().lower()
+    code = int(text, 16) if text.startswith("0x") else int(text)
+    if not 0 <= code <= 0xFFFF:
+        raise ValueError(f"invalid input source {value!r}")
+    return str(code)
+
+
+FEATURE_PARSERS = {
+    "brightness": parse_level,
+    "volume": parse_level,
+    "mute": parse_mute,
+    "source": parse_source,
+}
+
+# 协调器中还没有这个显示器的数据时使用的空快照
+_NO_STATE = DisplayState()
+
+
 class MonitorDevice:
     """Representation of a Monitor device."""
 
@@ -20,26 +106,58 @@ class MonitorDevice:
         hass: HomeAssistant,
         name: str,
         base_url: str,
+        options: Mapping[str, Any] | None = None,
+        supported_sources: Iterable[str] | None = None,
     ) -> None:
         """Initialize the device."""
         self.hass = hass
         self.name = name
+        # 配置时读取到的支持的输入源编码，None 表示未知
+        self.supported_sources = frozenset(supported_sources) if supported_sources else None
         self._base_url = base_url.rstrip('/')  # 移除末尾的斜杠
-        self._brightness = 0.5
-        self._volume = 0.5
-        self._mute_state = 'off'
-        self._source = "0"
-        # 添加 unique_id 属性
-        self.unique_id = f"{DOMAIN}_{name}"
-        
-        # 创建更新协调器
-        self.coordinator = DataUpdateCoordinator(
+        # 每个功能解析失败的次数和最后一次错误
+        self.parse_errors: dict[str, int] = {}
+        self.last_parse_errors: dict[str, str] = {}
+        # 同时进行的相同读取和写入共享一次请求
+        self._reads = SingleFlight(hass, f"{name} read")
+        self._writes = SingleFlight(hass, f"{name} write")
+        self.skipped_writes = 0
+        self._apply_options(options or {})
+        # 同一主机的显示器共享一个 hub，由 hub 统一轮询
+        self._hub = async_get_hub(hass, self, self._base_url)
+        # 滑块拖动时只发送最新的值，写完后延迟确认变更过的功能
+        self._verify_features: set[str] = set()
+        self._verify_debouncer = Debouncer(
             hass,
             _LOGGER,
-            name="monitor_values",
-            update_method=self._async_update_data,
-            update_interval=timedelta(seconds=30),  # 每30秒更新一次
+            cooldown=self.verify_delay,
+            immediate=False,
+            function=self._async_verify,
         )
+        self._writers = {
+            feature: CoalescingWriter(
+                hass,
+                f"{name} {feature}",
+                partial(self._async_send, feature),
+                partial(self._async_schedule_verify, feature),
+            )
+            for feature in ("brightness", "volume")
+        }
+        self._ramps = {
+            feature: TransitionRamp(
+                hass,
+                f"{name} {feature}",
+                partial(self._async_submit_write, feature),
+                TRANSITION_MAX_RATE,
+                TRANSITION_RESOLUTION,
+            )
+            for feature in ("brightness", "volume")
+        }
+        # 添加 unique_id 属性
+        self.unique_id = f"{DOMAIN}_{name}"
+        # 配置变更后通知实体切换协调器并更新名称
+        self.signal_reconfigured = f"{DOMAIN}_{self.unique_id}_reconfigured"
+        self._async_restore()
 
         # 添加设备信息
         self._attr_device_info = DeviceInfo(
@@ -55,122 +173,529 @@ class MonitorDevice:
         )
 
     async def update_config(self, config_entry: ConfigEntry) -> None:
-        """更新配置."""
-        # _LOGGER.info("更新配置: %s", config_entry.data)
-        self._base_url = config_entry.data[CONF_BASE_URL]
-        self.name = config_entry.data[CONF_DEVICE_NAME]
+        """更新配置，主机或名称变化时迁移到新的 hub，不重建实体."""
+        name = config_entry.data[CONF_DEVICE_NAME]
+        base_url = config_entry.data[CONF_BASE_URL].rstrip('/')
+        supported = config_entry.data.get(CONF_SUPPORTED_SOURCES)
+        self.supported_sources = frozenset(supported) if supported else None
+        self._apply_options(config_entry.options)
+        self._verify_debouncer.cooldown = self.verify_delay
+        moved = name != self.name or base_url != self._base_url
+        if moved:
+            old_name, old_unique_id = self.name, self.unique_id
+            await self._async_move(name, base_url)
+            self._async_update_registries(config_entry, old_name, old_unique_id)
+        self._hub.async_update_bounds()
+        async_dispatcher_send(self.hass, self.signal_reconfigured)
+        if moved:
+            # 立即读取一次新主机上的状态
+            await self._hub.coordinator.async_refresh()
+
+    async def _async_move(self, name: str, base_url: str) -> None:
+        """切换到新的显示器名称或主机，保留设备、实体和连接池."""
+        old_hub = self._hub
+        for ramp in self._ramps.values():
+            ramp.async_cancel()
+        # 新主机上的值需要重新读取，旧值在首次刷新前继续显示
+        state = self.state.updated({f"{feature}_fetched_at": None for feature in FEATURE_FIELDS})
+        old_hub.async_remove_display_data(self.name)
+        if (store := self.hass.data[DOMAIN].get(DATA_STORE)) is not None:
+            store.async_remove(self.unique_id)
+
+        self.name = name
+        self._base_url = base_url
+        self.unique_id = f"{DOMAIN}_{name}"
+
+        if base_url != old_hub.base_url:
+            hubs = self.hass.data[DOMAIN].get(DATA_HUBS, {})
+            if old_hub.devices == {self} and base_url not in hubs:
+                # 主机上只有这一个显示器，直接把 hub 连同协调器和会话迁移过去
+                old_hub.async_rehost(base_url)
+            else:
+                self._hub = async_get_hub(self.hass, self, base_url)
+                await async_release_hub(self.hass, self, old_hub)
+        # 重新获取显示器列表，新名称才会被轮询
+        self._hub.displays = None
+        self._hub.async_restore_display_data(name, state)
+
+    @callback
+    def _async_update_registries(
+        self, config_entry: ConfigEntry, old_name: str, old_unique_id: str
+    ) -> None:
+        """原地迁移设备和实体的标识，重新加载后不会出现重复的设备和实体."""
+        old_identifiers = self._attr_device_info["identifiers"]
+        identifiers = {(DOMAIN, self.name)}
+        self._attr_device_info["identifiers"] = identifiers
+        self._attr_device_info["name"] = self.name
+        self._attr_device_info["configuration_url"] = self._base_url
+        device_registry = dr.async_get(self.hass)
+        if (device := device_registry.async_get_device(identifiers=old_identifiers)) is not None:
+            device_registry.async_update_device(
+                device.id,
+                new_identifiers=identifiers,
+                name=self.name,
+                configuration_url=self._base_url,
+            )
 
-    async def _async_update_data(self):
-        """获取最新的显示器数据."""
+        if self.name == old_name:
+            return
+        # 实体的 unique_id 以显示器名称或设备 unique_id 开头
+        prefixes = (
+            (f"{old_unique_id}_", f"{self.unique_id}_"),
+            (f"{old_name}_", f"{self.name}_"),
+        )
+        entity_registry = er.async_get(self.hass)
+        for entity in er.async_entries_for_config_entry(entity_registry, config_entry.entry_id):
+            for old, new in prefixes:
+                if not entity.unique_id.startswith(old):
+                    continue
+                new_unique_id = f"{new}{entity.unique_id[len(old):]}"
+                try:
+                    entity_registry.async_update_entity(
+                        entity.entity_id, new_unique_id=new_unique_id
+                    )
+                except ValueError as err:
+                    _LOGGER.warning("Cannot migrate %s: %s", entity.entity_id, err)
+                break
+
+    def _apply_options(self, options: Mapping[str, Any]) -> None:
+        """读取选项中的可调参数."""
+        self.verify_delay = options.get(CONF_VERIFY_DELAY, DEFAULT_VERIFY_DELAY)
+        self.min_interval = options.get(CONF_MIN_INTERVAL, DEFAULT_MIN_INTERVAL)
+        self.max_interval = options.get(CONF_MAX_INTERVAL, DEFAULT_MAX_INTERVAL)
+        software_ttl = options.get(CONF_SOFTWARE_TTL, DEFAULT_SOFTWARE_TTL)
+        source_ttl = options.get(CONF_SOURCE_TTL, DEFAULT_SOURCE_TTL)
+        # None 表示只在需要时读取（首次、写入后确认或手动刷新）
+        self.feature_ttl: dict[str, float | None] = {
+            "brightness": software_ttl,
+            "volume": software_ttl,
+            "mute": software_ttl,
+            "source": source_ttl or None,
+        }
+        self.push = options.get(CONF_PUSH, False)
+        if self.push:
+            # 推送模式下轮询只作为兜底
+            self.min_interval = self.max_interval = max(self.max_interval, PUSH_SAFETY_INTERVAL)
+
+    @callback
+    def _async_restore(self) -> None:
+        """从缓存恢复上次的状态，首次轮询完成前先显示这些值."""
+        if (store := self.hass.data[DOMAIN].get(DATA_STORE)) is None:
+            return
+        if (saved := store.get(self.unique_id)) is None:
+            return
         try:
-            async with async_timeout.timeout(10):
-                async with aiohttp.ClientSession() as session:
-                    # 获取音量
-                    volume_url = f"{self._base_url}/get?feature=volume&name={self.name}"
-                    async with session.get(volume_url) as resp:
-                        if resp.status == 200:
-                            self._volume = float(await resp.text())
-
-                    # 获取静音状态
-                    volume_url = f"{self._base_url}/get?feature=mute&name={self.name}"
-                    async with session.get(volume_url) as resp:
-                        if resp.status == 200:
-                            self._mute_state = str(await resp.text()).strip()
-
-                    # 获取亮度
-                    brightness_url = f"{self._base_url}/get?feature=brightness&name={self.name}"
-                    async with session.get(brightness_url) as resp:
-                        if resp.status == 200:
-                            self._brightness = float(await resp.text())
-                    
-                    # 获取输入源
-                    source_url = f"{self._base_url}/get?feature=ddc&vcp=inputSelect&name={self.name}"
-                    async with session.get(source_url) as resp:
-                        if resp.status == 200:
-                            self._source = str(await resp.text()).strip()
-                        else:
-                            self._source = "0"
-
-                    return {
-                        "brightness": self._brightness,
-                        "volume": self._volume,
-                        "source": self._source,
-                        "mute_state": self._mute_state
-                    }
-        except Exception as err:
-            raise UpdateFailed(f"Error communicating with device: {err}")
+            state = DisplayState.from_dict(saved)
+        except (KeyError, TypeError, ValueError):
+            return
+        self._hub.async_restore_display_data(self.name, state)
 
-    async def async_set_brightness(self, brightness: float) -> None:
-        """Set monitor brightness."""
+    async def _async_verify(self) -> None:
+        """写入完成后确认设备状态."""
+        features, self._verify_features = self._verify_features, set()
+        changes, errors = await self._async_read_features(features)
+        if errors:
+            _LOGGER.debug("Failed to verify %s on %s: %s", list(errors), self.name, errors)
+        if len(errors) == len(features):
+            # 全部读取失败时不发布，避免把不可达的主机显示为可用
+            return
+        self._async_publish(changes)
+
+    async def async_close(self) -> None:
+        """从 hub 注销."""
+        for ramp in self._ramps.values():
+            ramp.async_cancel()
+        await self._verify_debouncer.async_shutdown()
+        await async_release_hub(self.hass, self, self._hub)
+
+    @property
+    def base_url(self) -> str:
+        """Return the BetterDisplay server URL."""
+        return self._base_url
+
+    @property
+    def hub(self) -> BetterDisplayHub:
+        """Return the hub polling this display."""
+        return self._hub
+
+    @property
+    def fetched(self) -> bool:
+        """Return True once any feature has been read from the host."""
+        return self.state.fetched
+
+    @property
+    def available(self) -> bool:
+        """Return True once the hub has state for this display."""
+        return self.coordinator.data is not None and self.name in self.coordinator.data
+
+    @property
+    def coordinator(self) -> DataUpdateCoordinator:
+        """Return the coordinator of the host hub."""
+        return self._hub.coordinator
+
+    async def _async_fetch_feature(self, feature: str) -> str | None:
+        """读取单个功能的值，同时进行的相同读取共享一次请求."""
+        return await self._reads.async_do(feature, partial(self._async_get_feature, feature))
+
+    async def _async_get_feature(self, feature: str) -> str | None:
+        """读取单个功能的值，每个功能有独立的超时."""
+        async with self._hub.scheduler.async_slot(self._base_url):
+            return await self._hub.client.async_get(
+                {**FEATURE_QUERIES[feature], "name": self.name}, FEATURE_TIMEOUT
+            )
+
+    @callback
+    def _apply_features(
+        self, values: Mapping[str, str | None], stale: Iterable[str] = ()
+    ) -> tuple[dict[str, Any], dict[str, Exception]]:
+        """将读取到的值转换为快照的变更，返回变更和无法解析的功能.
+
+        stale 中的功能不记录读取时间，下一次刷新时重新读取.
+        """
+        now = time.monotonic()
+        changes: dict[str, Any] = {f"{feature}_fetched_at": None for feature in stale}
+        errors: dict[str, Exception] = {}
+        for feature, value in values.items():
+            if (writer := self._writers.get(feature)) is not None and (
+                writer.busy or self._ramps[feature].running
+            ):
+                # 写入或渐变尚未完成，保留本地值避免滑块回跳
+                continue
+            if value is None:
+                if feature == "source":
+                    # 不支持 DDC 读取时返回非 200，视为未知输入源，按缓存时间再读取
+                    changes["source"] = SOURCE_UNKNOWN
+                    changes["source_fetched_at"] = now
+                # 其他功能没有读到值，不记录读取时间，旧值不算已确认
+                continue
+            try:
+                parsed = FEATURE_PARSERS[feature](value)
+            except ValueError as err:
+                # 单个功能解析失败时保留旧值，不影响其他功能
+                errors[feature] = err
+                self._record_parse_error(feature, err)
+                continue
+            changes[FEATURE_FIELDS[feature]] = parsed
+            changes.setdefault(f"{feature}_fetched_at", now)
+        return changes, errors
+
+    async def _async_fetch_batch(self, features: list[str]) -> dict[str, str | None] | None:
+        """一次请求读取多个功能，主机不支持时返回 None."""
+        return await self._reads.async_do(
+            tuple(features), partial(self._async_get_batch, features)
+        )
+
+    async def _async_get_batch(self, features: list[str]) -> dict[str, str | None] | None:
+        """发送批量读取请求并解析 JSON 结果."""
+        async with self._hub.scheduler.async_slot(self._base_url):
+            text = await self._hub.client.async_get(
+                {**BATCH_QUERY, "feature": ",".join(features), "name": self.name},
+                FEATURE_TIMEOUT,
+            )
         try:
-            url = f"{self._base_url}/set?feature=brightness&name={self.name}&value={brightness}"
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        self._brightness = brightness
-                        # 强制更新数据
-                        await self.coordinator.async_request_refresh()
-        except Exception as err:
-            _LOGGER.error("Error setting brightness: %s", err)
+            data = json.loads(text) if text is not None else None
+        except ValueError:
+            data = None
+        if not isinstance(data, dict) or not any(feature in data for feature in features):
+            if self._hub.batch_get is None:
+                # 名称错误的 404 不能说明主机不支持批量读取，只有显示器确实存在时才下结论
+                if self._hub.displays and self.name in self._hub.displays:
+                    self._async_batch_unsupported()
+                return None
+            if text is None:
+                # 非 200 时退回单独读取，由单独读取决定结果
+                return None
+            raise ValueError(f"invalid batched response {text!r}")
+        self._hub.batch_get = True
+        values: dict[str, str | None] = {}
+        for feature in features:
+            if (value := data.get(feature)) is None:
+                continue
+            if isinstance(value, bool):
+                value = "on" if value else "off"
+            values[feature] = str(value)
+        return values
 
-    async def async_set_volume(self, volume: float) -> None:
-        """Set monitor volume."""
+    @callback
+    def _async_batch_unsupported(self) -> None:
+        """Stop trying batched reads on this host."""
+        _LOGGER.debug("%s does not support batched reads", self._base_url)
+        self._hub.batch_get = False
+
+    @callback
+    def _record_parse_error(self, feature: str, err: Exception) -> None:
+        """Count a value of a feature that could not be parsed."""
+        self.parse_errors[feature] = self.parse_errors.get(feature, 0) + 1
+        self.last_parse_errors[feature] = str(err)
+
+    async def _async_read_features(
+        self, features
+    ) -> tuple[dict[str, Any], dict[str, Exception]]:
+        """并发读取多个功能，返回快照的变更和读取失败的功能."""
+        features = list(features)
+        errors = {}
+        values = {}
+        batched = None
+        batch = [feature for feature in features if feature in BATCH_FEATURES]
+        if len(batch) > 1 and self._hub.batch_get is not False:
+            try:
+                batched = await self._async_fetch_batch(batch)
+            except ValueError as err:
+                # 批量结果无法解析，按功能计入解析错误，再逐个功能单独读取
+                for feature in batch:
+                    self._record_parse_error(feature, err)
+            except Exception as err:  # noqa: BLE001
+                errors.update(dict.fromkeys(batch, err))
+            if batched is not None:
+                values.update(batched)
+            # 批量结果中缺少的功能单独读取
+            features = [
+                feature
+                for feature in features
+                if feature not in values and feature not in errors
+            ]
+
+        results = await asyncio.gather(
+            *(self._async_fetch_feature(feature) for feature in features),
+            return_exceptions=True,
+        )
+        for feature, result in zip(features, results):
+            if isinstance(result, BaseException):
+                # 读取失败时保留上一次的值
+                errors[feature] = result
+            else:
+                values[feature] = result
+        if (
+            len(batch) > 1
+            and batched is None
+            and self._hub.batch_get is None
+            and any(values.get(feature) is not None for feature in batch)
+        ):
+            # 批量读取无结果而单独读取成功，说明显示器存在但主机不支持批量读取
+            self._async_batch_unsupported()
+        changes, parse_errors = self._apply_features(values)
+        errors.update(parse_errors)
+        return changes, errors
+
+    @property
+    def dedup_stats(self) -> dict[str, int]:
+        """Return the requests saved by sharing and skipping, for diagnostics."""
+        return {
+            "reads": self._reads.calls,
+            "shared_reads": self._reads.shared,
+            "writes": self._writes.calls,
+            "collapsed_writes": self._writes.shared,
+            "skipped_writes": self.skipped_writes,
+        }
+
+    @property
+    def state(self) -> DisplayState:
+        """Return the snapshot the coordinator published for this display."""
+        if (data := self.coordinator.data) and (state := data.get(self.name)) is not None:
+            return state
+        return _NO_STATE
+
+    def _stale_features(self) -> list[str]:
+        """Return the features whose cached value has expired."""
+        now = time.monotonic()
+        state = self.state
+        stale = []
+        for feature in FEATURE_QUERIES:
+            if (fetched_at := state.fetched_at(feature)) is None:
+                stale.append(feature)
+            elif (ttl := self.feature_ttl[feature]) is not None and now - fetched_at >= ttl:
+                stale.append(feature)
+        return stale
+
+    async def async_fetch_state(self) -> dict[str, Any]:
+        """读取缓存已过期的功能，返回快照的变更，由 hub 在刷新结束时统一发布."""
+        features = self._stale_features()
+        changes, errors = await self._async_read_features(features)
+        if errors and len(errors) == len(features):
+            raise ConnectionError(f"Error communicating with device: {errors}")
+        if errors:
+            _LOGGER.debug("Failed to read %s from %s: %s", list(errors), self.name, errors)
+        return changes
+
+    @callback
+    def _async_publish(self, changes: Mapping[str, Any]) -> None:
+        """把变更应用到已发布的快照并推送到协调器，不触发轮询.
+
+        状态只保存在协调器中，发布是改变状态的唯一途径.
+        """
+        self._hub.async_set_display_data(self.name, self.state.updated(changes))
+
+    async def async_refresh_feature(self, feature: str) -> None:
+        """按需读取单个功能，例如只刷新输入源."""
+        changes, errors = await self._async_read_features([feature])
+        if errors:
+            _LOGGER.debug("Failed to read %s from %s: %s", feature, self.name, errors[feature])
+            return
+        self._async_publish(changes)
+
+    @callback
+    def async_handle_push(self, values: Mapping[str, Any]) -> list[str]:
+        """应用主机推送的值，返回已应用的功能."""
+        pushed = {}
+        for feature in FEATURE_QUERIES:
+            if (value := values.get(feature)) is None:
+                continue
+            if isinstance(value, bool):
+                value = "on" if value else "off"
+            pushed[feature] = str(value)
+        changes, errors = self._apply_features(pushed)
+        applied = [feature for feature in pushed if feature not in errors]
+        if applied:
+            self._async_publish(changes)
+        return applied
+
+    async def _async_schedule_verify(self, feature: str) -> None:
+        """延迟后只重新读取变更过的功能."""
+        self._verify_features.add(feature)
+        await self._verify_debouncer.async_call()
+
+    def _is_current(self, feature: str, value: Any) -> bool:
+        """目标值与已读取确认的当前值相同时不需要写入."""
+        state = self.state
+        if state.fetched_at(feature) is None:
+            return False
+        if feature == "source" and state.source == SOURCE_UNKNOWN:
+            return False
+        if (writer := self._writers.get(feature)) is not None and (
+            writer.busy or self._ramps[feature].running
+        ):
+            return False
+        return getattr(state, FEATURE_FIELDS[feature]) == value
+
+    async def _async_send(self, feature: str, value) -> bool:
+        """Send a single feature write, sharing an identical write in flight."""
+        return await self._writes.async_do(
+            (feature, str(value)), partial(self._async_post, feature, value)
+        )
+
+    async def _async_post(self, feature: str, value) -> bool:
+        """Send a single feature write."""
+        if feature == "source":
+            params = {"vcp": "inputSelect", "name": self.name, "ddc": value}
+        else:
+            params = {"feature": feature, "name": self.name, "value": value}
         try:
-            url = f"{self._base_url}/set?feature=volume&name={self.name}&value={volume}"
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        self._volume = volume
-                        # 强制更新数据
-                        await self.coordinator.async_request_refresh()
+            return await self._hub.client.async_set(params)
         except Exception as err:
-            _LOGGER.error("Error setting volume: %s", err)
+            _LOGGER.error("Error setting %s: %s", feature, err)
+            return False
+
+    def _check_reachable(self) -> None:
+        """主机不可达时立即拒绝写入."""
+        if self._hub.client.breaker.is_open:
+            self._hub.client.breaker.rejected += 1
+            raise HomeAssistantError(f"{self.name} is unreachable at {self._base_url}")
+
+    def _normalize_source(self, source_value: str) -> str:
+        """把输入源编码统一为十进制，能力字符串中没有列出的编码只记录警告."""
+        try:
+            code = parse_source(str(source_value))
+        except ValueError as err:
+            raise HomeAssistantError(
+                f"Invalid input source {source_value!r} for {self.name}"
+            ) from err
+        if self.supported_sources is not None and code not in self.supported_sources:
+            # DDC 能力字符串经常漏掉可用的输入源，不在本地拦截
+            _LOGGER.warning(
+                "%s does not list input %s as supported (%s), sending it anyway",
+                self.name,
+                code,
+                sorted(self.supported_sources, key=int),
+            )
+        return code
+
+    @callback
+    def _async_submit_write(self, feature: str, value: float) -> None:
+        """先更新本地状态，实际写入由队列合并后发送."""
+        # 本地值尚未经设备确认，写入失败后重试同一个值时不能被当作无变化跳过
+        self._async_publish({feature: value, f"{feature}_fetched_at": None})
+        self._writers[feature].async_submit(value)
+
+    async def _async_set_level(
+        self, feature: str, value: float, transition: float | None
+    ) -> None:
+        """Set brightness or volume, optionally as a transition."""
+        self._check_reachable()
+        self._hub.async_note_activity()
+        ramp = self._ramps[feature]
+        ramp.async_cancel()
+        if transition:
+            start = getattr(self.state, feature)
+            ramp.async_start(start, value, transition)
+            return
+        if self._is_current(feature, value):
+            self.skipped_writes += 1
+            return
+        self._async_submit_write(feature, value)
+
+    async def async_set_brightness(
+        self, brightness: float, transition: float | None = None
+    ) -> None:
+        """Set monitor brightness."""
+        await self._async_set_level("brightness", brightness, transition)
+
+    async def async_set_volume(self, volume: float, transition: float | None = None) -> None:
+        """Set monitor volume."""
+        await self._async_set_level("volume", volume, transition)
 
     async def async_mute_volume(self, mute_value: str) -> None:
         """Set monitor volume."""
-        try:
-            url = f"{self._base_url}/set?feature=mute&name={self.name}&value={mute_value}"
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        # 强制更新数据
-                        self._mute_state = mute_value
-                        await self.coordinator.async_request_refresh()
-        except Exception as err:
-            _LOGGER.error("Error setting volume: %s", err)
+        self._check_reachable()
+        self._hub.async_note_activity()
+        if self._is_current("mute", mute_value):
+            self.skipped_writes += 1
+            return
+        if await self._async_send("mute", mute_value):
+            self._async_publish({"mute_state": mute_value})
+            await self._async_schedule_verify("mute")
 
     async def switch_source(self, source_value: str) -> None:
         """Switch input source."""
-        try:
-            url = f"{self._base_url}/set?vcp=inputSelect&name={self.name}&ddc={source_value}"
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        _LOGGER.info("Successfully switched to source: %s", source_value)
-                        # 强制更新数据
-                        self._source = source_value
-                        await self.coordinator.async_request_refresh()
-        except Exception as err:
-            _LOGGER.error("Failed to switch source: %s", err)
+        source_value = self._normalize_source(source_value)
+        self._check_reachable()
+        self._hub.async_note_activity()
+        if self._is_current("source", source_value):
+            # 已经是当前输入源，不再发送 DDC 写入
+            self.skipped_writes += 1
+            return
+        if await self._async_send("source", source_value):
+            _LOGGER.info("Successfully switched to source: %s", source_value)
+            self._async_publish({"source": source_value})
+            await self._async_schedule_verify("source")
 
-    @property
-    def brightness(self) -> float:
-        """Return the brightness of the monitor."""
-        return self._brightness
-
-    @property
-    def volume(self) -> float:
-        """Return the volume of the monitor."""
-        return self._volume
-    
-    @property
-    def source(self) -> str:
-        """Return the source of the monitor."""
-        return self._source
-    
-    @property
-    def mute_state(self) -> str:
-        return self._mute_state
+    async def async_write_values(self, values: Mapping[str, Any]) -> dict[str, bool]:
+        """写入多个功能，不做确认读取，由调用方统一刷新."""
+        if "source" in values:
+            values = {**values, "source": self._normalize_source(values["source"])}
+        self._check_reachable()
+        self._hub.async_note_activity()
+        for feature in values:
+            if (ramp := self._ramps.get(feature)) is not None:
+                # 停止渐变并丢弃排队的值，避免旧值在批量写入之后落地
+                ramp.async_cancel()
+                await self._writers[feature].async_cancel()
+        results = {}
+        sent = {}
+        for feature, value in values.items():
+            if self._is_current(feature, value):
+                self.skipped_writes += 1
+                results[feature] = True
+                continue
+            sent[feature] = value
+            results[feature] = await self._async_send(feature, value)
+        if sent:
+            # 下一次刷新时重新读取写入过的功能
+            changes, _ = self._apply_features(
+                {feature: str(value) for feature, value in sent.items() if results[feature]},
+                stale=sent,
+            )
+            self._async_publish(changes)
+        return results
 
     @property
     def device_info(self):
@@ -0,0 +1,51 @@
+"""Diagnostics support for the BetterDisplay integration."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_WEBHOOK_ID, DOMAIN
+from .device import MonitorDevice
+
+TO_REDACT = {CONF_WEBHOOK_ID}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    device: MonitorDevice = hass.data[DOMAIN][entry.entry_id]
+    hub = device.hub
+    coordinator = hub.coordinator
+    return {
+        "entry": {
+            "data": async_redact_data(entry.data, TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "device": {
+            "name": device.name,
+            "state": device.state.as_dict(),
+            "parse_errors": dict(device.parse_errors),
+            "last_parse_errors": dict(device.last_parse_errors),
+            "requests_saved": device.dedup_stats,
+        },
+        "hub": {
+            "base_url": hub.base_url,
+            "displays": hub.displays,
+            "batch_get": hub.batch_get,
+            "devices": sorted(d.name for d in hub.devices),
+            "last_update_success": coordinator.last_update_success,
+            "listeners": coordinator.as_dict(),
+            "scheduler": {
+                **hub.interval.as_dict(),
+                "phase": round(hub.scheduler.phase(hub.base_url), 3),
+            },
+            "breaker": hub.client.breaker.as_dict(),
+            "client": dict(hub.client.metrics),
+            "timings": hub.client.timings.as_dict(),
+        },
+        "refresh_scheduler": hub.scheduler.as_dict(),
+    }
@@ -0,0 +1,61 @@
+"""Base entity for the BetterDisplay integration."""
+from __future__ import annotations
+
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.update_coordinator import BaseCoordinatorEntity, CoordinatorEntity
+
+from .device import MonitorDevice
+from .hub import DisplayCoordinator
+
+
+class MonitorEntity(CoordinatorEntity[DisplayCoordinator]):
+    """Coordinator entity that follows its display when it is reconfigured."""
+
+    _name_suffix: str
+
+    def __init__(self, device: MonitorDevice, keys: tuple[str, ...] | None = None) -> None:
+        """Initialize the entity; with keys it is only notified when they change."""
+        super().__init__(device.coordinator, (device, keys) if keys else None)
+        self._device = device
+        self._attr_name = f"{device.name} {self._name_suffix}"
+        self._attr_device_info = device.device_info
+        self._unsub_coordinator: CALLBACK_TYPE | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to the coordinator and to reconfiguration of the display."""
+        # 跳过 CoordinatorEntity 的注册，监听器由本类管理以便切换协调器
+        await super(BaseCoordinatorEntity, self).async_added_to_hass()
+        self._async_subscribe()
+        self.async_on_remove(self._async_unsubscribe)
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, self._device.signal_reconfigured, self._async_reconfigured
+            )
+        )
+
+    @callback
+    def _async_subscribe(self) -> None:
+        self._unsub_coordinator = self.coordinator.async_add_listener(
+            self._handle_coordinator_update, self.coordinator_context
+        )
+
+    @callback
+    def _async_unsubscribe(self) -> None:
+        if self._unsub_coordinator is not None:
+            self._unsub_coordinator()
+            self._unsub_coordinator = None
+
+    @callback
+    def _async_reconfigured(self) -> None:
+        """Move to the coordinator of the new host and pick up the new name."""
+        if self.coordinator is not self._device.coordinator:
+            self._async_unsubscribe()
+            self.coordinator = self._device.coordinator
+            self._async_subscribe()
+        self._attr_name = f"{self._device.name} {self._name_suffix}"
+        # 改名时设备已在注册表中迁移了 unique_id
+        if (entry := er.async_get(self.hass).async_get(self.entity_id)) is not None:
+            self._attr_unique_id = entry.unique_id
+        self.async_write_ha_state()
@@ -8,11 +8,9 @@ from homeassistant.components.fan import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
-
-
 from .const import DOMAIN
 from .device import MonitorDevice
+from .entity import MonitorEntity
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -21,32 +19,35 @@ async def async_setup_entry(
 ) -> None:
     """Set up the Monitor volume control."""
     device = hass.data[DOMAIN][config_entry.entry_id]
-    await device.coordinator.async_config_entry_first_refresh()
     async_add_entities([MonitorVolumeFan(device)])
 
-class MonitorVolumeFan(CoordinatorEntity, FanEntity):
+class MonitorVolumeFan(MonitorEntity, FanEntity):
     """Representation of Monitor volume control."""
 
+    _name_suffix = "Volume"
+
     def __init__(self, device: MonitorDevice) -> None:
-        super().__init__(device.coordinator)
-        self._device = device
+        super().__init__(device, ("volume", "mute_state"))
         self._attr_unique_id = f"{device.name}_volume"
-        self._attr_name = f"{device.name} Volume"
-        self._attr_device_info = device.device_info
         self._attr_supported_features = FanEntityFeature.SET_SPEED | \
                                         FanEntityFeature.TURN_ON | \
                                         FanEntityFeature.TURN_OFF
         self._attr_icon = "mdi:volume-high"
 
+    @property
+    def available(self) -> bool:
+        """Return True if the display has been read."""
+        return super().available and self._device.available
+
     @property
     def is_on(self) -> bool:
         """Return true if fan is on."""
-        return self._device.mute_state == 'off'
+        return self._device.state.mute_state == 'off'
 
     @property
     def percentage(self) -> int | None:
         """Return the current speed percentage."""
-        return int(self._device.volume * 100)
+        return int(self._device.state.volume * 100)
 
     async def async_set_percentage(self, percentage: int) -> None:
         """Set the speed percentage."""
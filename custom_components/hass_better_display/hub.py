@@ -0,0 +1,350 @@
+"""Per-host hub polling every display of one BetterDisplay server."""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .client import BetterDisplayClient, HostUnavailableError
+from .const import (
+    DATA_HUBS,
+    DATA_STORE,
+    DEFAULT_MAX_INTERVAL,
+    DEFAULT_MIN_INTERVAL,
+    DOMAIN,
+    PROBE_INTERVAL,
+    STARTUP_REFRESH_TIMEOUT,
+)
+from .scheduler import AdaptiveInterval, async_get_scheduler
+from .state import DisplayState
+
+if TYPE_CHECKING:
+    from .device import MonitorDevice
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class DisplayCoordinator(DataUpdateCoordinator[dict[str, DisplayState]]):
+    """Coordinator that only notifies the entities whose values changed.
+
+    Entities register with a ``(device, keys)`` context. Listeners without a
+    context are always notified.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the coordinator."""
+        super().__init__(*args, **kwargs)
+        self._notified_data: dict[str, DisplayState] | None = None
+        self._notified_success: bool | None = None
+        self.notified = 0
+        self.suppressed = 0
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify the listeners whose display or features changed."""
+        previous, self._notified_data = self._notified_data, self.data
+        # 刷新成功与失败切换时所有实体的可用性都会变化
+        success_changed = self._notified_success != self.last_update_success
+        self._notified_success = self.last_update_success
+        for update_callback, context in list(self._listeners.values()):
+            if success_changed or context is None or self._changed(previous, context):
+                self.notified += 1
+                update_callback()
+            else:
+                self.suppressed += 1
+
+    def _changed(
+        self,
+        previous: dict[str, DisplayState] | None,
+        context: tuple[MonitorDevice, tuple[str, ...]],
+    ) -> bool:
+        """Return True if the display appeared, vanished or one of the keys changed."""
+        device, keys = context
+        old = (previous or {}).get(device.name)
+        new = (self.data or {}).get(device.name)
+        if old is None or new is None:
+            return old is not new
+        return any(getattr(old, key) != getattr(new, key) for key in keys)
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the listener counters for diagnostics."""
+        return {"notified": self.notified, "suppressed": self.suppressed}
+
+
+class BetterDisplayHub:
+    """One coordinator and one HTTP client per BetterDisplay host."""
+
+    def __init__(self, hass: HomeAssistant, base_url: str) -> None:
+        """Initialize the hub."""
+        self.hass = hass
+        self.base_url = base_url
+        self.client = BetterDisplayClient(hass, base_url, self._async_breaker_changed)
+        self._unsub_probe: CALLBACK_TYPE | None = None
+        self._first_refresh: asyncio.Task | None = None
+        self.devices: set[MonitorDevice] = set()
+        # 主机上的显示器列表，只在第一次刷新时获取
+        self.displays: list[str] | None = None
+        # 主机是否支持一次读取多个功能，None 表示尚未检测
+        self.batch_get: bool | None = None
+        self.interval = AdaptiveInterval(DEFAULT_MIN_INTERVAL, DEFAULT_MAX_INTERVAL)
+        # 各主机错开刷新时间，并共享全局的并发上限
+        self.scheduler = async_get_scheduler(hass)
+        self.scheduler.async_register(base_url)
+
+        self.coordinator = DisplayCoordinator(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN} {base_url}",
+            update_method=self._async_update_data,
+            update_interval=self._paced_interval(),
+        )
+
+    async def async_first_refresh(self, device: MonitorDevice) -> None:
+        """Refresh once for every entry of this host without blocking startup."""
+        if device.fetched:
+            return
+        if self._first_refresh is None or self._first_refresh.done():
+            self._first_refresh = self.hass.async_create_background_task(
+                self.coordinator.async_refresh(), f"{DOMAIN} first refresh {self.base_url}"
+            )
+        if device.available:
+            # 已从缓存恢复状态，刷新在后台完成
+            return
+        try:
+            # 主机不可达时不再等待，刷新在后台继续，实体先显示为不可用
+            async with asyncio.timeout(STARTUP_REFRESH_TIMEOUT):
+                await asyncio.shield(self._first_refresh)
+        except TimeoutError:
+            _LOGGER.debug("First refresh of %s continues in the background", self.base_url)
+
+    async def async_shutdown(self) -> None:
+        """Stop polling and release the client."""
+        self.async_cancel_probe()
+        if self._first_refresh is not None:
+            self._first_refresh.cancel()
+        await self.coordinator.async_shutdown()
+        self.scheduler.async_unregister(self.base_url)
+        self.client.async_close()
+
+    @callback
+    def _async_breaker_changed(self) -> None:
+        """Pause polling while the host is unreachable and probe in the background."""
+        if self.client.breaker.is_open:
+            _LOGGER.warning("%s is unreachable, pausing requests", self.base_url)
+            if self._unsub_probe is None:
+                self._unsub_probe = async_track_time_interval(
+                    self.hass,
+                    self._async_probe,
+                    timedelta(seconds=PROBE_INTERVAL),
+                    name=f"{DOMAIN} probe {self.base_url}",
+                    cancel_on_shutdown=True,
+                )
+            self.coordinator.async_set_update_error(
+                HostUnavailableError(f"{self.base_url} is unreachable")
+            )
+            return
+
+        _LOGGER.info("%s is reachable again", self.base_url)
+        self.async_cancel_probe()
+        self.async_note_activity()
+        self.hass.async_create_task(self.coordinator.async_request_refresh())
+
+    async def _async_probe(self, now: datetime) -> None:
+        """Check whether the host answers again."""
+        await self.client.async_probe()
+
+    @callback
+    def async_cancel_probe(self) -> None:
+        """Stop probing the host."""
+        if self._unsub_probe is not None:
+            self._unsub_probe()
+            self._unsub_probe = None
+
+    @callback
+    def async_update_bounds(self) -> None:
+        """Use the tightest polling bounds of the displays on this host."""
+        if not self.devices:
+            return
+        self.interval.async_set_bounds(
+            min(device.min_interval for device in self.devices),
+            min(device.max_interval for device in self.devices),
+        )
+        self.coordinator.update_interval = self._paced_interval()
+
+    @callback
+    def async_note_activity(self) -> None:
+        """Poll quickly again after a user command."""
+        self.interval.async_activity()
+        self.coordinator.update_interval = self._paced_interval()
+
+    def _paced_interval(self) -> timedelta:
+        """Return the adaptive interval shifted onto the phase of this host."""
+        return self.scheduler.next_interval(
+            self.base_url, self.interval.current, self.hass.loop.time()
+        )
+
+    @callback
+    def async_restore_display_data(self, name: str, state: DisplayState) -> None:
+        """Seed the coordinator with a saved state before entities exist."""
+        self.coordinator.data = {**(self.coordinator.data or {}), name: state}
+
+    @callback
+    def _async_save(self, data: dict[str, DisplayState]) -> None:
+        """Remember the state of the displays for the next start."""
+        if (store := self.hass.data[DOMAIN].get(DATA_STORE)) is None:
+            return
+        for device in self.devices:
+            if (state := data.get(device.name)) is not None:
+                store.async_update(device.unique_id, state.as_dict())
+
+    @callback
+    def async_remove_display_data(self, name: str) -> None:
+        """Drop a display that moved away, without notifying the listeners."""
+        if self.coordinator.data and name in self.coordinator.data:
+            self.coordinator.data = {
+                key: state for key, state in self.coordinator.data.items() if key != name
+            }
+
+    @callback
+    def async_rehost(self, base_url: str) -> None:
+        """Point this hub, its coordinator and its session at another host."""
+        hubs: dict[str, BetterDisplayHub] = self.hass.data[DOMAIN].setdefault(DATA_HUBS, {})
+        if hubs.get(self.base_url) is self:
+            del hubs[self.base_url]
+        hubs[base_url] = self
+        _LOGGER.info("Moving hub from %s to %s", self.base_url, base_url)
+        self.scheduler.async_unregister(self.base_url)
+        self.scheduler.async_register(base_url)
+        self.async_cancel_probe()
+        self.base_url = base_url
+        self.coordinator.name = f"{DOMAIN} {base_url}"
+        self.displays = None
+        self.batch_get = None
+        self.client.async_set_base_url(base_url)
+
+    @callback
+    def async_set_display_data(self, name: str, state: DisplayState) -> None:
+        """Publish the state of one display without polling the host."""
+        data = dict(self.coordinator.data or {})
+        data[name] = state
+        if not self.coordinator.last_update_success:
+            # 上次刷新失败时只更新数据，可用性和轮询间隔仍由下一次刷新决定
+            self.coordinator.data = data
+            self.coordinator.async_update_listeners()
+        else:
+            self.coordinator.async_set_updated_data(data)
+        self._async_save(data)
+
+    async def _async_discover_displays(self) -> None:
+        """List the displays known to the BetterDisplay server."""
+        text = await self.client.async_get({"identifiers": ""})
+        displays: list[str] = []
+        if text is not None:
+            try:
+                # 返回的是以逗号分隔的 JSON 对象
+                identifiers = json.loads(f"[{text}]")
+                displays = [item["name"] for item in identifiers if "name" in item]
+            except (ValueError, TypeError, KeyError) as err:
+                _LOGGER.debug("Unexpected identifiers from %s: %s", self.base_url, err)
+        self.displays = displays
+
+        for device in self.devices:
+            if displays and device.name not in displays:
+                _LOGGER.warning(
+                    "Display %s not found on %s, available: %s",
+                    device.name,
+                    self.base_url,
+                    displays,
+                )
+
+    def _polled_devices(self) -> list[MonitorDevice]:
+        """Return the devices that exist on the host."""
+        if not self.displays:
+            return list(self.devices)
+        return [device for device in self.devices if device.name in self.displays]
+
+    async def _async_update_data(self) -> dict[str, DisplayState]:
+        """Refresh all displays and adapt the polling interval."""
+        previous = self.coordinator.data
+        start = time.perf_counter()
+        self.client.breaker.async_next_round()
+        try:
+            if self.client.breaker.is_open:
+                raise UpdateFailed(f"{self.base_url} is unreachable")
+            data = await self._async_fetch_all()
+            if self.client.breaker.is_open:
+                # 刷新途中断路器打开，已读到的部分数据不再可信
+                raise UpdateFailed(f"{self.base_url} is unreachable")
+        except UpdateFailed:
+            self.interval.async_failed()
+            raise
+        else:
+            if data == previous:
+                self.interval.async_unchanged()
+            else:
+                self.interval.async_activity()
+                self._async_save(data)
+        finally:
+            self.coordinator.update_interval = self._paced_interval()
+            self.client.timings.add_refresh((time.perf_counter() - start) * 1000)
+        return data
+
+    async def _async_fetch_all(self) -> dict[str, DisplayState]:
+        """Fetch the state of every display in one refresh cycle."""
+        if self.displays is None:
+            try:
+                await self._async_discover_displays()
+            except Exception as err:  # noqa: BLE001
+                _LOGGER.debug("Failed to list displays on %s: %s", self.base_url, err)
+
+        devices = self._polled_devices()
+        results = await asyncio.gather(
+            *(device.async_fetch_state() for device in devices),
+            return_exceptions=True,
+        )
+
+        # 在刷新结束时才把读取到的变更应用到已发布的快照，期间的写入不会被覆盖
+        data: dict[str, DisplayState] = {}
+        errors: dict[str, BaseException] = {}
+        for device, result in zip(devices, results):
+            if isinstance(result, BaseException):
+                errors[device.name] = result
+            else:
+                data[device.name] = device.state.updated(result)
+
+        if devices and not data:
+            raise UpdateFailed(f"Error communicating with {self.base_url}: {errors}")
+        if errors:
+            _LOGGER.debug("Failed to refresh %s on %s: %s", list(errors), self.base_url, errors)
+        return data
+
+
+@callback
+def async_get_hub(hass: HomeAssistant, device: MonitorDevice, base_url: str) -> BetterDisplayHub:
+    """Register a device with the hub for its host, creating the hub if needed."""
+    hubs: dict[str, BetterDisplayHub] = hass.data[DOMAIN].setdefault(DATA_HUBS, {})
+    if (hub := hubs.get(base_url)) is None:
+        hub = hubs[base_url] = BetterDisplayHub(hass, base_url)
+    hub.devices.add(device)
+    hub.async_update_bounds()
+    return hub
+
+
+async def async_release_hub(hass: HomeAssistant, device: MonitorDevice, hub: BetterDisplayHub) -> None:
+    """Unregister a device and close the hub once no device uses it."""
+    hub.devices.discard(device)
+    if hub.devices:
+        hub.async_update_bounds()
+        return
+    hubs: dict[str, BetterDisplayHub] = hass.data[DOMAIN].get(DATA_HUBS, {})
+    if hubs.get(hub.base_url) is hub:
+        del hubs[hub.base_url]
+    await hub.async_shutdown()
+    _LOGGER.debug("Closed hub for %s: %s", hub.base_url, hub.client.metrics)
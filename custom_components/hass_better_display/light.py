@@ -4,15 +4,16 @@ from __future__ import annotations
 from homeassistant.components.light import (
     LightEntity,
     ATTR_BRIGHTNESS,
+    ATTR_TRANSITION,
     ColorMode,
+    LightEntityFeature,
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
-
 from .const import DOMAIN
 from .device import MonitorDevice
+from .entity import MonitorEntity
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -21,39 +22,45 @@ async def async_setup_entry(
 ) -> None:
     """Set up the Monitor brightness control."""
     device = hass.data[DOMAIN][config_entry.entry_id]
-    await device.coordinator.async_config_entry_first_refresh()
     async_add_entities([MonitorBrightnessLight(device)])
 
-class MonitorBrightnessLight(CoordinatorEntity, LightEntity):
+class MonitorBrightnessLight(MonitorEntity, LightEntity):
     """Representation of Monitor brightness control."""
 
+    _name_suffix = "Brightness"
+
     def __init__(self, device: MonitorDevice) -> None:
-        super().__init__(device.coordinator)
-        self._device = device
+        super().__init__(device, ("brightness",))
         self._attr_unique_id = f"{device.name}_brightness"
-        self._attr_name = f"{device.name} Brightness"
-        self._attr_device_info = device.device_info
         self._attr_color_mode = ColorMode.BRIGHTNESS
         self._attr_supported_color_modes = {ColorMode.BRIGHTNESS}
+        self._attr_supported_features = LightEntityFeature.TRANSITION
         self._attr_icon = "mdi:brightness-6"
 
+    @property
+    def available(self) -> bool:
+        """Return True if the display has been read."""
+        return super().available and self._device.available
+
     @property
     def is_on(self) -> bool:
         """Return true if light is on."""
-        return self._device.brightness > 0
+        return self._device.state.brightness > 0
 
     @property
     def brightness(self) -> int:
         """Return the brightness of this light between 0..255."""
-        return int(self._device.brightness * 255)
+        return int(self._device.state.brightness * 255)
 
     async def async_turn_on(self, **kwargs) -> None:
         """Turn the light on."""
         if ATTR_BRIGHTNESS in kwargs:
             brightness = round(kwargs[ATTR_BRIGHTNESS] / 255, 2)
-            await self._device.async_set_brightness(brightness)
+            await self._device.async_set_brightness(
+                brightness, kwargs.get(ATTR_TRANSITION)
+            )
         # else:
-        #     await self._device.async_set_brightness(self._device.brightness)
+        #     await self._device.async_set_brightness(self._device.state.brightness)
 
     async def async_turn_off(self, **kwargs) -> None:
         """Turn the light off."""
@@ -0,0 +1,72 @@
+"""Push updates from BetterDisplay hosts through a Home Assistant webhook."""
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+
+from aiohttp import hdrs, web
+
+from homeassistant.components import webhook
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .const import CONF_WEBHOOK_ID, DOMAIN
+from .device import MonitorDevice
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@callback
+def async_register_push(
+    hass: HomeAssistant, entry: ConfigEntry, device: MonitorDevice
+) -> Callable[[], None]:
+    """Register the push webhook of a display and return its remover."""
+    webhook_id = entry.data[CONF_WEBHOOK_ID]
+
+    async def handle_webhook(
+        hass: HomeAssistant, webhook_id: str, request: web.Request
+    ) -> web.Response:
+        """Apply the values sent by the host, e.g. {"brightness": 0.6}."""
+        try:
+            values = await request.json()
+        except ValueError:
+            values = dict(request.query)
+        if not isinstance(values, dict):
+            return web.Response(status=400)
+
+        applied = device.async_handle_push(values)
+        if not applied:
+            _LOGGER.debug("Ignored push for %s: %s", device.name, values)
+            return web.Response(status=400)
+        return web.Response(status=200)
+
+    @callback
+    def register() -> None:
+        webhook.async_register(
+            hass,
+            DOMAIN,
+            f"{DOMAIN} {device.name}",
+            webhook_id,
+            handle_webhook,
+            local_only=True,
+            allowed_methods=(hdrs.METH_POST, hdrs.METH_PUT),
+        )
+
+    @callback
+    def reconfigured() -> None:
+        """Register again so the webhook carries the new display name."""
+        webhook.async_unregister(hass, webhook_id)
+        register()
+
+    register()
+    unsub_reconfigured = async_dispatcher_connect(
+        hass, device.signal_reconfigured, reconfigured
+    )
+
+    @callback
+    def unregister() -> None:
+        unsub_reconfigured()
+        webhook.async_unregister(hass, webhook_id)
+
+    return unregister
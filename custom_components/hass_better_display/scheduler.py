@@ -0,0 +1,171 @@
+"""Polling schedule for the BetterDisplay integration."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import timedelta
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    DATA_SCHEDULER,
+    DOMAIN,
+    SCHEDULER_CONCURRENCY,
+    SCHEDULER_HOST_CONCURRENCY,
+)
+from .stats import Histogram
+
+# 黄金分割步长，主机数未知时也能让相位在区间内均匀分布
+_PHASE_STEP = 0.6180339887498949
+
+
+class AdaptiveInterval:
+    """Poll interval that speeds up on activity and backs off when idle."""
+
+    def __init__(self, minimum: float, maximum: float) -> None:
+        """Initialize the interval."""
+        self.minimum = minimum
+        self.maximum = maximum
+        self.current = minimum
+        self.unchanged = 0
+        self.failures = 0
+
+    @property
+    def update_interval(self) -> timedelta:
+        """Return the current interval for the coordinator."""
+        return timedelta(seconds=self.current)
+
+    @callback
+    def async_set_bounds(self, minimum: float, maximum: float) -> None:
+        """Change the bounds, keeping the current interval inside them."""
+        self.minimum = minimum
+        self.maximum = max(minimum, maximum)
+        self.current = min(max(self.current, self.minimum), self.maximum)
+
+    @callback
+    def async_activity(self) -> None:
+        """Poll at the fastest rate after a command or detected change."""
+        self.unchanged = 0
+        self.failures = 0
+        self.current = self.minimum
+
+    @callback
+    def async_unchanged(self) -> None:
+        """Back off while values stay the same."""
+        self.unchanged += 1
+        self.failures = 0
+        self._async_back_off()
+
+    @callback
+    def async_failed(self) -> None:
+        """Back off while the host is unreachable."""
+        self.failures += 1
+        self._async_back_off()
+
+    @callback
+    def _async_back_off(self) -> None:
+        self.current = min(self.current * 2, self.maximum)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the scheduler state for diagnostics."""
+        return {
+            "interval": self.current,
+            "minimum": self.minimum,
+            "maximum": self.maximum,
+            "unchanged_refreshes": self.unchanged,
+            "consecutive_failures": self.failures,
+        }
+
+
+class RefreshScheduler:
+    """Spread the refreshes of all hosts and bound their concurrent reads."""
+
+    def __init__(self, limit: int, host_limit: int) -> None:
+        """Initialize the scheduler."""
+        self.limit = limit
+        self.host_limit = host_limit
+        self._semaphore = asyncio.Semaphore(limit)
+        self._host_semaphores: dict[str, asyncio.Semaphore] = {}
+        self._slots: dict[str, int] = {}
+        self.in_flight = 0
+        self.waiting = 0
+        self.max_waiting = 0
+        self.lag = Histogram()
+
+    @callback
+    def async_register(self, host: str) -> None:
+        """Give a host the first free phase slot."""
+        used = set(self._slots.values())
+        self._slots[host] = next(slot for slot in range(len(used) + 1) if slot not in used)
+        self._host_semaphores[host] = asyncio.Semaphore(self.host_limit)
+
+    @callback
+    def async_unregister(self, host: str) -> None:
+        """Release the phase slot of a host."""
+        self._slots.pop(host, None)
+        self._host_semaphores.pop(host, None)
+
+    def phase(self, host: str) -> float:
+        """Return the offset of a host as a fraction of its interval."""
+        return self._slots.get(host, 0) * _PHASE_STEP % 1
+
+    def next_interval(self, host: str, seconds: float, now: float) -> timedelta:
+        """Return a delay close to seconds that lands on the phase of the host."""
+        offset = self.phase(host) * seconds
+        target = round((now + seconds - offset) / seconds) * seconds + offset
+        return timedelta(seconds=max(target - now, seconds / 2))
+
+    @asynccontextmanager
+    async def async_slot(self, host: str) -> AsyncIterator[None]:
+        """Wait for a free request slot of the host and of the integration."""
+        host_semaphore = self._host_semaphores.get(host)
+        start = time.perf_counter()
+        self.waiting += 1
+        self.max_waiting = max(self.max_waiting, self.waiting)
+        try:
+            # 先占用主机的名额，避免一台主机排队时占住全局名额
+            if host_semaphore is not None:
+                await host_semaphore.acquire()
+            try:
+                await self._semaphore.acquire()
+            except BaseException:
+                if host_semaphore is not None:
+                    host_semaphore.release()
+                raise
+        finally:
+            self.waiting -= 1
+        self.lag.add((time.perf_counter() - start) * 1000)
+        self.in_flight += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            self._semaphore.release()
+            if host_semaphore is not None:
+                host_semaphore.release()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the scheduler state for diagnostics."""
+        return {
+            "hosts": len(self._slots),
+            "limit": self.limit,
+            "host_limit": self.host_limit,
+            "in_flight": self.in_flight,
+            "queue_depth": self.waiting,
+            "max_queue_depth": self.max_waiting,
+            "lag": self.lag.as_dict(),
+        }
+
+
+@callback
+def async_get_scheduler(hass: HomeAssistant) -> RefreshScheduler:
+    """Return the scheduler shared by all hosts."""
+    data = hass.data[DOMAIN]
+    if (scheduler := data.get(DATA_SCHEDULER)) is None:
+        scheduler = data[DATA_SCHEDULER] = RefreshScheduler(
+            SCHEDULER_CONCURRENCY, SCHEDULER_HOST_CONCURRENCY
+        )
+    return scheduler
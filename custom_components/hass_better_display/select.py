@@ -6,14 +6,13 @@ from typing import Any, Dict
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import CONF_SOURCE_LIST, DOMAIN
-from .device import MonitorDevice
-
-from homeassistant.helpers import entity_registry as er
-import asyncio
+from .device import MonitorDevice, parse_source
+from .entity import MonitorEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -23,66 +22,57 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the Monitor Display select."""
-    _LOGGER.info(f"select 初始化")
     device = hass.data[DOMAIN][config_entry.entry_id]
-    await device.coordinator.async_config_entry_first_refresh()
-    select_entity = MonitorSelect(device, config_entry)
-
-    #将 select_entity 添加到 hass.data[DOMAIN]["entities"] 中
-    if "entities" not in hass.data[DOMAIN]:
-        hass.data[DOMAIN]["entities"] = {}
-    hass.data[DOMAIN]["entities"][select_entity._attr_unique_id] = select_entity
-
-    async_add_entities([select_entity])
+    async_add_entities([MonitorSelect(device, config_entry)])
 
-    # 监听配置变更
-    async def config_update(hass, entry):
-        # 获取旧的select_entity
-        old_select_entity = hass.data[DOMAIN]["entities"][select_entity._attr_unique_id]
-        await old_select_entity.update_config(entry)
-        
-    # 注册更新监听器
-    config_entry.async_on_unload(
-        config_entry.add_update_listener(config_update)
-    )
 
-    
-
-class MonitorSelect(SelectEntity):
+class MonitorSelect(MonitorEntity, SelectEntity):
     """Representation of a Monitor Display select."""
 
+    _name_suffix = "Input Source"
+
     def __init__(self, device: MonitorDevice, config_entry: ConfigEntry) -> None:
         """Initialize the select."""
-        self._device = device
-        self._source_list = config_entry.data.get(CONF_SOURCE_LIST, {})
+        super().__init__(device, ("source",))
+        self._config_entry = config_entry
         self._attr_unique_id = f"{device.unique_id}_input_source_select"
-        self._attr_name = f"{device.name} Input Source"
-        self._attr_options = self._generate_options()
-        self._attr_device_info = device.device_info
+        self._build_mapping(config_entry.data.get(CONF_SOURCE_LIST, {}))
+
+    def _build_mapping(self, source_list: Dict[str, str]) -> None:
+        """只在配置变化时生成选项和编码之间的映射."""
+        self._option_to_code = {}
+        for key, value in source_list.items():
+            try:
+                # 旧配置中可能写成 0x11，与读取到的十进制编码对齐
+                value = parse_source(value)
+            except ValueError:
+                pass
+            self._option_to_code[f"切换到 {key}"] = value
+        self._code_to_option = {value: option for option, value in self._option_to_code.items()}
+        self._attr_options = list(self._option_to_code)
 
-    def _generate_options(self) -> list[str]:
-        """生成选项列表."""
-        return [f"切换到 {key}" for key in self._source_list.keys()]
-
-    def _generate_source_mapping(self) -> Dict[str, str]:
-        """生成源映射."""
-        return {value: f"切换到 {key}" for key, value in self._source_list.items()}
+    @property
+    def available(self) -> bool:
+        """Return True if the display has been read."""
+        return super().available and self._device.available
 
     @property
     def current_option(self) -> str | None:
         """返回当前选中的选项。"""
-        source_value = self._device.source
-        source_mapping = self._generate_source_mapping()
-        return source_mapping.get(source_value)
+        return self._code_to_option.get(self._device.state.source)
+
+    async def async_update(self) -> None:
+        """Re-read the input source on demand."""
+        await self._device.async_refresh_feature("source")
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
-        option = option.split(" ")[1]
-        if option in self._source_list.keys():
-            await self._device.switch_source(self._source_list.get(option))
-
-    async def update_config(self, config_entry: ConfigEntry) -> None:
-        """Update the config."""
-        self._source_list = config_entry.data.get(CONF_SOURCE_LIST, {})
-        self._attr_options = self._generate_options()
-        self.async_write_ha_state()
\ No newline at end of file
+        if (code := self._option_to_code.get(option)) is None:
+            raise HomeAssistantError(f"Unknown input source option: {option}")
+        await self._device.switch_source(code)
+
+    @callback
+    def _async_reconfigured(self) -> None:
+        """Rebuild the options from the updated entry."""
+        self._build_mapping(self._config_entry.data.get(CONF_SOURCE_LIST, {}))
+        super()._async_reconfigured()
@@ -0,0 +1,124 @@
+"""Diagnostic sensors for Monitor Control integration."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from .breaker import STATE_CLOSED, STATE_OPEN
+from .const import DOMAIN
+from .device import MonitorDevice
+from .entity import MonitorEntity
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the Monitor diagnostic sensors."""
+    device = hass.data[DOMAIN][config_entry.entry_id]
+    async_add_entities(
+        [
+            MonitorConnectionSensor(device),
+            MonitorRefreshDurationSensor(device),
+            MonitorRequestCountSensor(device),
+        ]
+    )
+
+class MonitorConnectionSensor(MonitorEntity, SensorEntity):
+    """Circuit breaker state of the BetterDisplay host."""
+
+    _name_suffix = "Connection"
+
+    def __init__(self, device: MonitorDevice) -> None:
+        super().__init__(device)
+        self._attr_unique_id = f"{device.name}_connection"
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        self._attr_device_class = SensorDeviceClass.ENUM
+        self._attr_options = [STATE_CLOSED, STATE_OPEN]
+        self._attr_icon = "mdi:lan-connect"
+
+    @property
+    def available(self) -> bool:
+        """The breaker state is known even when the host is down."""
+        return True
+
+    @property
+    def native_value(self) -> str:
+        """Return the breaker state."""
+        return self._device.hub.client.breaker.state
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the breaker counters."""
+        breaker = self._device.hub.client.breaker
+        return {
+            "consecutive_failures": breaker.failures,
+            "trips": breaker.trips,
+        }
+
+
+class MonitorRefreshDurationSensor(MonitorEntity, SensorEntity):
+    """Duration of the last refresh of the BetterDisplay host."""
+
+    _name_suffix = "Refresh Duration"
+
+    def __init__(self, device: MonitorDevice) -> None:
+        super().__init__(device)
+        self._attr_unique_id = f"{device.name}_refresh_duration"
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        self._attr_entity_registry_enabled_default = False
+        self._attr_device_class = SensorDeviceClass.DURATION
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+        self._attr_suggested_display_precision = 0
+
+    @property
+    def available(self) -> bool:
+        """Timings are kept even when the host is down."""
+        return True
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the last refresh duration."""
+        return self._device.hub.client.timings.last_refresh_ms
+
+
+class MonitorRequestCountSensor(MonitorEntity, SensorEntity):
+    """Number of HTTP requests sent to the BetterDisplay host."""
+
+    _name_suffix = "Requests"
+
+    def __init__(self, device: MonitorDevice) -> None:
+        super().__init__(device)
+        self._attr_unique_id = f"{device.name}_request_count"
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        self._attr_entity_registry_enabled_default = False
+        self._attr_state_class = SensorStateClass.TOTAL_INCREASING
+        self._attr_icon = "mdi:counter"
+
+    @property
+    def available(self) -> bool:
+        """Counters are kept even when the host is down."""
+        return True
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of requests."""
+        return self._device.hub.client.metrics["requests"]
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the byte and connection counters."""
+        metrics = self._device.hub.client.metrics
+        return {
+            "bytes_received": metrics["bytes_received"],
+            "connections_reused": metrics["connections_reused"],
+        }
@@ -0,0 +1,129 @@
+"""Services for the BetterDisplay integration."""
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+
+from .const import (
+    ATTR_BRIGHTNESS,
+    ATTR_DISPLAYS,
+    ATTR_MUTE,
+    ATTR_SOURCE,
+    ATTR_VOLUME,
+    BULK_HOST_CONCURRENCY,
+    CONF_SOURCE_LIST,
+    DOMAIN,
+    SERVICE_SET_DISPLAYS,
+)
+from .device import MonitorDevice
+from .hub import BetterDisplayHub
+
+SET_DISPLAYS_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Required(ATTR_DISPLAYS): vol.All(cv.ensure_list, [cv.string]),
+            vol.Optional(ATTR_BRIGHTNESS): vol.All(vol.Coerce(int), vol.Range(min=0, max=100)),
+            vol.Optional(ATTR_VOLUME): vol.All(vol.Coerce(int), vol.Range(min=0, max=100)),
+            vol.Optional(ATTR_MUTE): cv.boolean,
+            vol.Optional(ATTR_SOURCE): cv.string,
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_BRIGHTNESS, ATTR_VOLUME, ATTR_MUTE, ATTR_SOURCE),
+)
+
+
+def _display_values(call: ServiceCall, source_list: dict[str, str]) -> dict[str, Any]:
+    """Translate the service data into BetterDisplay values."""
+    values: dict[str, Any] = {}
+    if ATTR_BRIGHTNESS in call.data:
+        values["brightness"] = round(call.data[ATTR_BRIGHTNESS] / 100, 2)
+    if ATTR_VOLUME in call.data:
+        values["volume"] = round(call.data[ATTR_VOLUME] / 100, 2)
+    if ATTR_MUTE in call.data:
+        values["mute"] = "on" if call.data[ATTR_MUTE] else "off"
+    if ATTR_SOURCE in call.data:
+        # 可以填写输入源列表中的名称，也可以直接填写 DDC 编码
+        source = call.data[ATTR_SOURCE]
+        values["source"] = source_list.get(source, source)
+    return values
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services."""
+
+    async def async_set_displays(call: ServiceCall) -> ServiceResponse:
+        """Write the same values to many displays, grouped by host."""
+        start = time.perf_counter()
+        devices: dict[str, tuple[MonitorDevice, dict[str, str]]] = {}
+        for entry in hass.config_entries.async_entries(DOMAIN):
+            if (device := hass.data.get(DOMAIN, {}).get(entry.entry_id)) is not None:
+                devices[device.name] = (device, entry.data.get(CONF_SOURCE_LIST, {}))
+
+        results: dict[str, dict[str, Any]] = {}
+        groups: dict[BetterDisplayHub, list[tuple[MonitorDevice, dict[str, Any]]]] = {}
+        for name in call.data[ATTR_DISPLAYS]:
+            if name not in devices:
+                results[name] = {"success": False, "error": "unknown display"}
+                continue
+            device, source_list = devices[name]
+            groups.setdefault(device.hub, []).append(
+                (device, _display_values(call, source_list))
+            )
+        if not groups:
+            raise ServiceValidationError(f"No configured display in {call.data[ATTR_DISPLAYS]}")
+
+        async def async_write_display(
+            semaphore: asyncio.Semaphore, device: MonitorDevice, values: dict[str, Any]
+        ) -> None:
+            async with semaphore:
+                display_start = time.perf_counter()
+                try:
+                    written = await device.async_write_values(values)
+                except HomeAssistantError as err:
+                    results[device.name] = {"success": False, "error": str(err)}
+                    return
+                results[device.name] = {
+                    "success": all(written.values()),
+                    "written": [feature for feature, ok in written.items() if ok],
+                    "failed": [feature for feature, ok in written.items() if not ok],
+                    "latency_ms": round((time.perf_counter() - display_start) * 1000, 1),
+                }
+
+        async def async_write_host(
+            hub: BetterDisplayHub, items: list[tuple[MonitorDevice, dict[str, Any]]]
+        ) -> None:
+            # 每台主机限制并发，写完后统一刷新一次
+            semaphore = asyncio.Semaphore(BULK_HOST_CONCURRENCY)
+            await asyncio.gather(
+                *(async_write_display(semaphore, device, values) for device, values in items)
+            )
+            await hub.coordinator.async_refresh()
+
+        await asyncio.gather(*(async_write_host(hub, items) for hub, items in groups.items()))
+
+        return {
+            "displays": results,
+            "latency_ms": round((time.perf_counter() - start) * 1000, 1),
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_DISPLAYS,
+        async_set_displays,
+        schema=SET_DISPLAYS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -0,0 +1,35 @@
+"""Share identical in-flight calls between concurrent callers."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import TypeVar
+
+from homeassistant.core import HomeAssistant
+
+_T = TypeVar("_T")
+
+
+class SingleFlight:
+    """Run one call per key at a time; later callers await the same result."""
+
+    def __init__(self, hass: HomeAssistant, name: str) -> None:
+        """Initialize the group."""
+        self.hass = hass
+        self.name = name
+        self._calls: dict[Hashable, asyncio.Task] = {}
+        self.calls = 0
+        self.shared = 0
+
+    async def async_do(self, key: Hashable, func: Callable[[], Awaitable[_T]]) -> _T:
+        """Return the result of func, sharing a call already running for key."""
+        if (task := self._calls.get(key)) is not None:
+            self.shared += 1
+        else:
+            self.calls += 1
+            task = self._calls[key] = self.hass.async_create_task(
+                func(), f"{self.name} {key}"
+            )
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+        # 某个调用方被取消时不影响其他等待同一结果的调用方
+        return await asyncio.shield(task)
@@ -0,0 +1,81 @@
+"""Immutable state snapshot of one display."""
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+# 功能名与快照字段的对应关系
+FEATURE_FIELDS = {
+    "brightness": "brightness",
+    "volume": "volume",
+    "mute": "mute_state",
+    "source": "source",
+}
+
+# 输入源未知（尚未读取或显示器不支持 DDC 读取）
+SOURCE_UNKNOWN = "0"
+
+
+@dataclass(frozen=True, slots=True)
+class DisplayState:
+    """Values of one display as published by the coordinator.
+
+    The fetch timestamps (monotonic, None if not read since the last write)
+    are not part of equality, so an unchanged refresh compares equal.
+    """
+
+    brightness: float = 0.5
+    volume: float = 0.5
+    mute_state: str = "off"
+    source: str = SOURCE_UNKNOWN
+    brightness_fetched_at: float | None = field(default=None, compare=False)
+    volume_fetched_at: float | None = field(default=None, compare=False)
+    mute_fetched_at: float | None = field(default=None, compare=False)
+    source_fetched_at: float | None = field(default=None, compare=False)
+
+    def fetched_at(self, feature: str) -> float | None:
+        """Return when a feature was last read from the host."""
+        return getattr(self, f"{feature}_fetched_at")
+
+    def updated(self, changes: Mapping[str, Any]) -> DisplayState:
+        """Return a copy with changes applied.
+
+        Calls the constructor once with positional arguments, which is about
+        twice as fast as dataclasses.replace() on this frozen class.
+        """
+        get = changes.get
+        return DisplayState(
+            get("brightness", self.brightness),
+            get("volume", self.volume),
+            get("mute_state", self.mute_state),
+            get("source", self.source),
+            get("brightness_fetched_at", self.brightness_fetched_at),
+            get("volume_fetched_at", self.volume_fetched_at),
+            get("mute_fetched_at", self.mute_fetched_at),
+            get("source_fetched_at", self.source_fetched_at),
+        )
+
+    @property
+    def fetched(self) -> bool:
+        """Return True once any feature has been read from the host."""
+        return any(self.fetched_at(feature) is not None for feature in FEATURE_FIELDS)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the values for storage and diagnostics."""
+        return {
+            "brightness": self.brightness,
+            "volume": self.volume,
+            "source": self.source,
+            "mute_state": self.mute_state,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> DisplayState:
+        """Create a snapshot from saved values, raising on invalid data."""
+        return cls(
+            brightness=float(data["brightness"]),
+            volume=float(data["volume"]),
+            mute_state=str(data["mute_state"]),
+            source=str(data["source"]),
+        )
@@ -0,0 +1,86 @@
+"""In-memory request timing statistics."""
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import Any
+
+# 直方图桶的上界（毫秒），最后一个桶收集更慢的请求
+BUCKET_BOUNDS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class Histogram:
+    """Fixed-size latency histogram."""
+
+    __slots__ = ("counts", "count", "total_ms", "max_ms")
+
+    def __init__(self) -> None:
+        """Initialize the histogram."""
+        self.counts = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, value_ms: float) -> None:
+        """Record one sample."""
+        self.counts[bisect_left(BUCKET_BOUNDS_MS, value_ms)] += 1
+        self.count += 1
+        self.total_ms += value_ms
+        if value_ms > self.max_ms:
+            self.max_ms = value_ms
+
+    def percentile(self, pct: float) -> float | None:
+        """Return the upper bound of the bucket holding the percentile."""
+        if not self.count:
+            return None
+        rank = pct / 100 * self.count
+        seen = 0
+        for index, bucket in enumerate(self.counts):
+            seen += bucket
+            if seen >= rank:
+                if index < len(BUCKET_BOUNDS_MS):
+                    return min(BUCKET_BOUNDS_MS[index], round(self.max_ms, 2))
+                return round(self.max_ms, 2)
+        return self.max_ms
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram for diagnostics."""
+        labels = [f"<={bound}ms" for bound in BUCKET_BOUNDS_MS] + [f">{BUCKET_BOUNDS_MS[-1]}ms"]
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total_ms / self.count, 2) if self.count else None,
+            "p50_ms": self.percentile(50),
+            "p99_ms": self.percentile(99),
+            "max_ms": round(self.max_ms, 2),
+            "buckets": {label: count for label, count in zip(labels, self.counts) if count},
+        }
+
+
+class RequestTimings:
+    """Request and refresh timings of one host, keyed by feature and outcome."""
+
+    def __init__(self) -> None:
+        """Initialize the timings."""
+        self.requests: dict[tuple[str, str], Histogram] = {}
+        self.refresh = Histogram()
+        self.last_refresh_ms: float | None = None
+
+    def add_request(self, feature: str, outcome: str, value_ms: float) -> None:
+        """Record one HTTP request."""
+        if (histogram := self.requests.get((feature, outcome))) is None:
+            histogram = self.requests[(feature, outcome)] = Histogram()
+        histogram.add(value_ms)
+
+    def add_refresh(self, value_ms: float) -> None:
+        """Record one coordinator refresh."""
+        self.refresh.add(value_ms)
+        self.last_refresh_ms = value_ms
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the timings for diagnostics."""
+        return {
+            "refresh": self.refresh.as_dict(),
+            "requests": {
+                f"{feature}/{outcome}": histogram.as_dict()
+                for (feature, outcome), histogram in sorted(self.requests.items())
+            },
+        }
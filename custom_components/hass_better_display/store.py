@@ -0,0 +1,52 @@
+"""Last-known display state kept across restarts."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DATA_STORE, DOMAIN, STORE_SAVE_DELAY, STORE_VERSION
+
+
+class StateStore:
+    """Throttled storage of the last state of every display."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the store."""
+        self._store: Store[dict[str, dict[str, Any]]] = Store(
+            hass, STORE_VERSION, f"{DOMAIN}.state"
+        )
+        self._states: dict[str, dict[str, Any]] = {}
+
+    async def async_load(self) -> None:
+        """Load the saved states."""
+        self._states = await self._store.async_load() or {}
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return the saved state of a display."""
+        return self._states.get(key)
+
+    @callback
+    def async_update(self, key: str, state: dict[str, Any]) -> None:
+        """Remember a state; changes are written together after a delay."""
+        if self._states.get(key) == state:
+            return
+        self._states[key] = dict(state)
+        self._store.async_delay_save(self._data_to_save, STORE_SAVE_DELAY)
+
+    @callback
+    def async_remove(self, key: str) -> None:
+        """Forget the state of a removed display."""
+        if self._states.pop(key, None) is not None:
+            self._store.async_delay_save(self._data_to_save, STORE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, dict[str, Any]]:
+        return self._states
+
+
+async def async_setup_store(hass: HomeAssistant) -> None:
+    """Load the state store once for the integration."""
+    store = hass.data[DOMAIN][DATA_STORE] = StateStore(hass)
+    await store.async_load()
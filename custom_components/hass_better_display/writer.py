@@ -0,0 +1,117 @@
+"""Write path helpers for the BetterDisplay integration."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+_UNSET = object()
+
+
+class CoalescingWriter:
+    """Send only the latest value of a feature, one request in flight at a time."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        name: str,
+        send: Callable[[Any], Awaitable[bool]],
+        on_settled: Callable[[], Awaitable[None]],
+    ) -> None:
+        """Initialize the writer."""
+        self.hass = hass
+        self.name = name
+        self._send = send
+        self._on_settled = on_settled
+        self._pending: Any = _UNSET
+        self._running = False
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    @property
+    def busy(self) -> bool:
+        """Return True while values are still being sent."""
+        return self._running
+
+    @callback
+    def async_submit(self, value: Any) -> None:
+        """Queue a value, replacing any value not yet sent."""
+        self._pending = value
+        if not self._running:
+            self._running = True
+            self._idle.clear()
+            self.hass.async_create_task(self._async_drain(), f"{self.name} writer")
+
+    async def _async_drain(self) -> None:
+        """Send pending values until the queue is empty."""
+        try:
+            while self._pending is not _UNSET:
+                value, self._pending = self._pending, _UNSET
+                await self._send(value)
+        finally:
+            self._running = False
+            self._idle.set()
+        await self._on_settled()
+
+    async def async_cancel(self) -> None:
+        """Drop the value not yet sent and wait for the request in flight."""
+        self._pending = _UNSET
+        await self._idle.wait()
+
+
+class TransitionRamp:
+    """Move a feature to a target in rate-limited steps."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        name: str,
+        submit: Callable[[float], None],
+        max_rate: float,
+        resolution: float,
+    ) -> None:
+        """Initialize the ramp."""
+        self.hass = hass
+        self.name = name
+        self._submit = submit
+        self._max_rate = max_rate
+        self._resolution = resolution
+        self._task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        """Return True while a transition is in progress."""
+        return self._task is not None and not self._task.done()
+
+    @callback
+    def async_cancel(self) -> None:
+        """Stop the running transition at its current value."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    @callback
+    def async_start(self, start: float, target: float, duration: float) -> None:
+        """Start a transition, replacing any running one."""
+        self.async_cancel()
+        self._task = self.hass.async_create_task(
+            self._async_run(start, target, duration), f"{self.name} transition"
+        )
+
+    async def _async_run(self, start: float, target: float, duration: float) -> None:
+        """Submit the intermediate values on schedule."""
+        # 步数受链路速率和数值精度两方面限制
+        distance = round(abs(target - start) / self._resolution)
+        steps = max(1, min(int(duration * self._max_rate), distance))
+        interval = duration / steps
+        begin = self.hass.loop.time()
+        last = round(start, 2)
+        for step in range(1, steps + 1):
+            value = round(start + (target - start) * step / steps, 2)
+            if value != last:
+                self._submit(value)
+                last = value
+            if step < steps:
+                await asyncio.sleep(max(0, begin + step * interval - self.hass.loop.time()))
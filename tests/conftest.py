@@ -0,0 +1,171 @@
+"""Fixtures for the HASS Better Display tests."""
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import AsyncGenerator
+
+import pytest
+from aiohttp import web
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.hass_better_display.const import (
+    CONF_BASE_URL,
+    CONF_DEVICE_NAME,
+    CONF_SUPPORTED_SOURCES,
+    DOMAIN,
+)
+
+DISPLAY = "Studio"
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Load the integration from custom_components."""
+    yield
+
+
+class StubServer:
+    """In-loop stand-in for the BetterDisplay HTTP server."""
+
+    def __init__(self, displays: list[str]) -> None:
+        self.state = {
+            name: {"brightness": "0.5", "volume": "0.5", "mute": "off", "inputSelect": "15"}
+            for name in displays
+        }
+        self.latency = 0.0
+        self.batch = True
+        self.batch_body: str | None = None
+        self.identifiers = True
+        # 读取时直接断开连接，模拟主机读取失败
+        self.drop_reads = False
+        self.status: int | None = None
+        self.requests: list[dict[str, str]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._runner: web.AppRunner | None = None
+        self.port: int | None = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def count(self, path: str, **query: str) -> int:
+        """Count the requests made to path whose query contains query."""
+        return sum(
+            1
+            for request in self.requests
+            if request["path"] == path
+            and all(request.get(key) == value for key, value in query.items())
+        )
+
+    async def _delay(self, request: web.Request) -> None:
+        self.requests.append({"path": request.path, **request.query})
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+
+    async def handle_root(self, request: web.Request) -> web.Response:
+        await self._delay(request)
+        return web.Response(text="BetterDisplay")
+
+    async def handle_get(self, request: web.Request) -> web.Response:
+        await self._delay(request)
+        if self.drop_reads:
+            request.transport.close()
+            raise web.HTTPServiceUnavailable
+        if self.status is not None:
+            return web.Response(status=self.status)
+        query = request.query
+        if "identifiers" in query:
+            if not self.identifiers:
+                return web.Response(status=404)
+            return web.Response(
+                text=",".join(json.dumps({"name": name}) for name in self.state)
+            )
+        if (display := self.state.get(query.get("name", ""))) is None:
+            return web.Response(status=404)
+        if query.get("feature") == "ddcCapabilities":
+            return web.Response(text="(prot(monitor)vcp(10 12 60(0F 11 12)))")
+        if self.batch and query.get("format") == "json":
+            if self.batch_body is not None:
+                return web.Response(text=self.batch_body)
+            features = query.get("feature", "").split(",")
+            return web.json_response(
+                {feature: display[feature] for feature in features if feature in display}
+            )
+        key = query.get("vcp") if query.get("feature") == "ddc" else query.get("feature")
+        if key not in display:
+            return web.Response(status=404)
+        return web.Response(text=display[key])
+
+    async def handle_set(self, request: web.Request) -> web.Response:
+        await self._delay(request)
+        if self.status is not None:
+            return web.Response(status=self.status)
+        query = request.query
+        if (display := self.state.get(query.get("name", ""))) is None:
+            return web.Response(status=404)
+        if query.get("vcp") == "inputSelect":
+            display["inputSelect"] = query.get("ddc", "")
+        elif query.get("feature") in display:
+            display[query["feature"]] = query.get("value", "")
+        else:
+            return web.Response(status=404)
+        return web.Response(text="OK")
+
+    async def async_start(self) -> None:
+        app = web.Application()
+        app.router.add_get("/", self.handle_root)
+        app.router.add_get("/get", self.handle_get)
+        app.router.add_get("/set", self.handle_set)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+
+    async def async_stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+
+@pytest.fixture
+async def server(socket_enabled) -> AsyncGenerator[StubServer, None]:
+    """Start a stub BetterDisplay server on a free local port."""
+    stub = StubServer([DISPLAY, "Sidecar"])
+    await stub.async_start()
+    yield stub
+    await stub.async_stop()
+
+
+def mock_entry(server: StubServer, name: str = DISPLAY) -> MockConfigEntry:
+    """Return a config entry for a display on the stub server."""
+    return MockConfigEntry(
+        domain=DOMAIN,
+        title=name,
+        data={
+            CONF_BASE_URL: server.base_url,
+            CONF_DEVICE_NAME: name,
+            CONF_SUPPORTED_SOURCES: ["15", "17", "18"],
+        },
+    )
+
+
+@pytest.fixture
+def config_entry(server: StubServer) -> MockConfigEntry:
+    """Return a config entry pointing at the stub server."""
+    return mock_entry(server)
+
+
+@pytest.fixture
+async def setup_entry(hass, config_entry: MockConfigEntry) -> MockConfigEntry:
+    """Set up the config entry against the stub server."""
+    config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    return config_entry
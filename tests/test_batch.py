@@ -0,0 +1,77 @@
+"""Tests for batched reads."""
+from __future__ import annotations
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.hass_better_display.const import BATCH_FEATURES, DOMAIN
+
+from .conftest import DISPLAY, StubServer, mock_entry
+
+
+async def _setup(hass: HomeAssistant, *entries) -> None:
+    for entry in entries:
+        entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_unknown_display_keeps_batching(hass: HomeAssistant, server: StubServer) -> None:
+    """A misspelled display does not disable batched reads for its host."""
+    server.identifiers = False
+    missing = mock_entry(server, "Missing")
+    await _setup(hass, missing)
+    hub = hass.data[DOMAIN][missing.entry_id].hub
+    assert hub.batch_get is None
+
+    studio = mock_entry(server)
+    await _setup(hass, studio)
+    await hub.coordinator.async_refresh()
+    assert hub.batch_get is True
+
+
+async def test_host_without_batching(hass: HomeAssistant, server: StubServer) -> None:
+    """Batched reads stop once a known display answers single reads only."""
+    server.batch = False
+    entry = mock_entry(server)
+    await _setup(hass, entry)
+    device = hass.data[DOMAIN][entry.entry_id]
+    assert device.hub.batch_get is False
+    assert device.state.brightness == 0.5
+
+    server.requests.clear()
+    await device.hub.coordinator.async_refresh()
+    assert server.count("/get", format="json") == 0
+
+
+async def test_host_without_batching_or_identifiers(
+    hass: HomeAssistant, server: StubServer
+) -> None:
+    """Successful single reads prove the display exists."""
+    server.batch = False
+    server.identifiers = False
+    entry = mock_entry(server)
+    await _setup(hass, entry)
+    assert hass.data[DOMAIN][entry.entry_id].hub.batch_get is False
+
+
+@pytest.mark.parametrize("body", ["<html>", '{"error": "busy"}', '{"other": 1}'])
+async def test_invalid_batch_falls_back_to_single_reads(
+    hass: HomeAssistant, server: StubServer, setup_entry, body: str
+) -> None:
+    """An unusable batched body is recorded and the features are read one by one."""
+    device = hass.data[DOMAIN][setup_entry.entry_id]
+    assert device.hub.batch_get is True
+
+    server.batch_body = body
+    server.state[DISPLAY]["brightness"] = "0.8"
+    server.requests.clear()
+    await device.hub.coordinator.async_refresh()
+
+    assert device.hub.coordinator.last_update_success
+    for feature in BATCH_FEATURES:
+        assert device.parse_errors[feature] == 1
+        assert "invalid batched response" in device.last_parse_errors[feature]
+        assert server.count("/get", feature=feature, name=DISPLAY) == 1
+    assert device.state.brightness == 0.8
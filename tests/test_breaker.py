@@ -0,0 +1,63 @@
+"""Tests for the circuit breaker of a BetterDisplay host."""
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.hass_better_display.breaker import CircuitBreaker
+from custom_components.hass_better_display.const import BREAKER_THRESHOLD, DOMAIN
+
+from .conftest import StubServer
+
+
+def test_failures_count_once_per_round() -> None:
+    """Concurrent failures of one refresh count as one failure."""
+    breaker = CircuitBreaker(3)
+    for _ in range(2):
+        breaker.async_next_round()
+        assert not any([breaker.async_failure() for _ in range(4)])
+    assert breaker.failures == 2
+
+    breaker.async_next_round()
+    assert breaker.async_failure()
+    assert breaker.is_open
+
+    assert breaker.async_success()
+    assert not breaker.is_open
+    assert breaker.failures == 0
+
+
+async def test_breaker_opens_after_failed_refreshes(
+    hass: HomeAssistant, server: StubServer, setup_entry
+) -> None:
+    """One unreachable poll does not pause the host, repeated ones do."""
+    hub = hass.data[DOMAIN][setup_entry.entry_id].hub
+    await server.async_stop()
+
+    for failures in range(1, BREAKER_THRESHOLD):
+        await hub.coordinator.async_refresh()
+        assert hub.client.breaker.failures == failures
+        assert not hub.client.breaker.is_open
+
+    await hub.coordinator.async_refresh()
+    assert hub.client.breaker.is_open
+    assert not hub.coordinator.last_update_success
+
+
+async def test_slow_feature_reads_do_not_trip(
+    hass: HomeAssistant, server: StubServer, setup_entry
+) -> None:
+    """A per-feature read timeout means a slow DDC read, not a dead host."""
+    hub = hass.data[DOMAIN][setup_entry.entry_id].hub
+    server.latency = 0.2
+
+    with patch("custom_components.hass_better_display.device.FEATURE_TIMEOUT", 0.05):
+        for _ in range(BREAKER_THRESHOLD + 1):
+            await hub.coordinator.async_refresh()
+    # 让桩服务器处理完已放弃的请求
+    await asyncio.sleep(server.latency)
+
+    assert hub.client.breaker.failures == 0
+    assert not hub.client.breaker.is_open
@@ -0,0 +1,127 @@
+"""Tests for the config and options flows."""
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+from homeassistant import config_entries
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+from homeassistant.exceptions import HomeAssistantError
+
+from custom_components.hass_better_display.client import parse_input_sources
+from custom_components.hass_better_display.const import (
+    CONF_ALLOW_UNSUPPORTED,
+    CONF_BASE_URL,
+    CONF_DEVICE_NAME,
+    CONF_SOURCE_LIST,
+    CONF_SUPPORTED_SOURCES,
+    DOMAIN,
+)
+
+from .conftest import DISPLAY, StubServer
+
+
+def test_parse_input_sources() -> None:
+    """Input codes are read from the 60 entry of the capabilities string as decimals."""
+    assert parse_input_sources("(prot(monitor)vcp(10 12 60(0F 11 12)))") == ["15", "17", "18"]
+    assert parse_input_sources("(prot(monitor)vcp(10 12 62))") == []
+
+
+async def _async_user_step(hass: HomeAssistant, server: StubServer, **user_input):
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    with patch(
+        "custom_components.hass_better_display.async_setup_entry", return_value=True
+    ):
+        return await hass.config_entries.flow.async_configure(
+            result["flow_id"],
+            {CONF_DEVICE_NAME: DISPLAY, CONF_BASE_URL: server.base_url, **user_input},
+        )
+
+
+async def test_user_step_normalises_codes(hass: HomeAssistant, server: StubServer) -> None:
+    """Hex and zero-padded codes match the decimal codes read from the display."""
+    result = await _async_user_step(hass, server, **{CONF_SOURCE_LIST: "hdmi1:0x0F, dp:017"})
+
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert result["data"][CONF_SOURCE_LIST] == {"hdmi1": "15", "dp": "17"}
+    assert result["data"][CONF_SUPPORTED_SOURCES] == ["15", "17", "18"]
+    assert CONF_ALLOW_UNSUPPORTED not in result["data"]
+    assert server.count("/get", feature="ddcCapabilities") == 1
+
+
+async def test_user_step_unsupported_source(hass: HomeAssistant, server: StubServer) -> None:
+    """An unlisted code is reported and can be saved after opting out of the check."""
+    result = await _async_user_step(hass, server, **{CONF_SOURCE_LIST: "hdmi1:15,usb:0x1B"})
+    assert result["type"] == FlowResultType.FORM
+    assert result["errors"] == {"base": "unsupported_source"}
+    assert result["description_placeholders"] == {"supported": "15, 17, 18"}
+
+    result = await _async_user_step(
+        hass, server, **{CONF_SOURCE_LIST: "hdmi1:15,usb:0x1B", CONF_ALLOW_UNSUPPORTED: True}
+    )
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert result["data"][CONF_SOURCE_LIST] == {"hdmi1": "15", "usb": "27"}
+
+
+@pytest.mark.parametrize("source_list", ["hdmi1", "hdmi1:abc", "hdmi1:0x10000", "hdmi1:-1"])
+async def test_user_step_invalid_source_list(
+    hass: HomeAssistant, server: StubServer, source_list: str
+) -> None:
+    """Malformed entries and codes outside the DDC range are rejected before probing."""
+    result = await _async_user_step(hass, server, **{CONF_SOURCE_LIST: source_list})
+
+    assert result["type"] == FlowResultType.FORM
+    assert result["errors"] == {"base": "invalid_source_list"}
+    assert server.count("/get", feature="ddcCapabilities") == 0
+
+
+async def test_options_unsupported_source(
+    hass: HomeAssistant, server: StubServer, setup_entry
+) -> None:
+    """The options flow checks against the cached codes unless the display changed."""
+    result = await hass.config_entries.options.async_init(setup_entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {**result["data_schema"]({}), CONF_SOURCE_LIST: "hdmi1:0x0F,usb:27"}
+    )
+    assert result["type"] == FlowResultType.FORM
+    assert result["errors"] == {"base": "unsupported_source"}
+    assert server.count("/get", feature="ddcCapabilities") == 0
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {
+            **result["data_schema"]({}),
+            CONF_SOURCE_LIST: "hdmi1:0x0F,usb:27",
+            CONF_ALLOW_UNSUPPORTED: True,
+        },
+    )
+    await hass.async_block_till_done()
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert CONF_ALLOW_UNSUPPORTED not in result["data"]
+    assert setup_entry.data[CONF_SOURCE_LIST] == {"hdmi1": "15", "usb": "27"}
+    assert setup_entry.data[CONF_SUPPORTED_SOURCES] == ["15", "17", "18"]
+    assert server.count("/get", feature="ddcCapabilities") == 0
+
+    assert await hass.config_entries.async_unload(setup_entry.entry_id)
+
+
+async def test_switch_source_normalises_code(
+    hass: HomeAssistant, server: StubServer, setup_entry
+) -> None:
+    """Codes are sent as decimals and unlisted codes still reach the display."""
+    device = hass.data[DOMAIN][setup_entry.entry_id]
+
+    await device.switch_source("0x11")
+    assert server.count("/set", ddc="17") == 1
+    assert device.state.source == "17"
+
+    await device.switch_source("27")
+    assert server.count("/set", ddc="27") == 1
+
+    with pytest.raises(HomeAssistantError):
+        await device.switch_source("hdmi")
+
+    assert await hass.config_entries.async_unload(setup_entry.entry_id)
@@ -0,0 +1,60 @@
+"""Tests for the change-aware listener notification."""
+from __future__ import annotations
+
+import logging
+from types import SimpleNamespace
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.hass_better_display.hub import DisplayCoordinator
+from custom_components.hass_better_display.state import DisplayState
+
+STUDIO = SimpleNamespace(name="Studio")
+SIDECAR = SimpleNamespace(name="Sidecar")
+
+
+def _listen(coordinator: DisplayCoordinator, context) -> list[None]:
+    calls: list[None] = []
+    coordinator.async_add_listener(lambda: calls.append(None), context)
+    return calls
+
+
+async def test_only_changed_keys_notify(hass: HomeAssistant) -> None:
+    """A change reaches the entities of that display and feature only."""
+    coordinator = DisplayCoordinator(hass, logging.getLogger(__name__), name="test")
+    brightness = _listen(coordinator, (STUDIO, ("brightness",)))
+    source = _listen(coordinator, (STUDIO, ("source",)))
+    other = _listen(coordinator, (SIDECAR, ("brightness",)))
+    always = _listen(coordinator, None)
+
+    state = DisplayState()
+    coordinator.async_set_updated_data({"Studio": state, "Sidecar": state})
+    assert (len(brightness), len(source), len(other), len(always)) == (1, 1, 1, 1)
+
+    coordinator.async_set_updated_data(
+        {"Studio": state.updated({"brightness": 0.9}), "Sidecar": state}
+    )
+    assert (len(brightness), len(source), len(other), len(always)) == (2, 1, 1, 2)
+
+    # 只有读取时间变化的刷新不通知
+    coordinator.async_set_updated_data(
+        {"Studio": state.updated({"brightness": 0.9, "brightness_fetched_at": 5.0}),
+         "Sidecar": state}
+    )
+    assert (len(brightness), len(source), len(other), len(always)) == (2, 1, 1, 3)
+    assert coordinator.as_dict() == {"notified": 7, "suppressed": 5}
+
+
+async def test_vanished_display_and_failures_notify(hass: HomeAssistant) -> None:
+    """Availability changes reach every entity of the affected displays."""
+    coordinator = DisplayCoordinator(hass, logging.getLogger(__name__), name="test")
+    studio = _listen(coordinator, (STUDIO, ("brightness",)))
+    sidecar = _listen(coordinator, (SIDECAR, ("brightness",)))
+
+    state = DisplayState()
+    coordinator.async_set_updated_data({"Studio": state, "Sidecar": state})
+    coordinator.async_set_updated_data({"Studio": state})
+    assert (len(studio), len(sidecar)) == (1, 2)
+
+    coordinator.async_set_update_error(ConnectionError("down"))
+    assert (len(studio), len(sidecar)) == (2, 3)
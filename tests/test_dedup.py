@@ -0,0 +1,115 @@
+"""Tests for shared reads and skipped writes."""
+from __future__ import annotations
+
+import asyncio
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.hass_better_display.const import DOMAIN
+from custom_components.hass_better_display.singleflight import SingleFlight
+
+from .conftest import DISPLAY, StubServer
+
+
+async def test_single_flight_shares_calls(hass: HomeAssistant) -> None:
+    """Concurrent callers of one key share a call, other keys run their own."""
+    group = SingleFlight(hass, "test")
+    calls = []
+
+    async def read(key):
+        calls.append(key)
+        await asyncio.sleep(0.01)
+        return key
+
+    results = await asyncio.gather(
+        group.async_do("a", lambda: read("a")),
+        group.async_do("a", lambda: read("a")),
+        group.async_do("b", lambda: read("b")),
+    )
+    assert results == ["a", "a", "b"]
+    assert calls == ["a", "b"]
+    assert (group.calls, group.shared) == (2, 1)
+
+    # 完成后的调用不再共享旧结果
+    assert await group.async_do("a", lambda: read("a")) == "a"
+    assert calls == ["a", "b", "a"]
+
+
+async def test_single_flight_shares_errors(hass: HomeAssistant) -> None:
+    """A failed call fails every caller waiting on it."""
+    group = SingleFlight(hass, "test")
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ConnectionError("down")
+
+    results = await asyncio.gather(
+        group.async_do("a", fail), group.async_do("a", fail), return_exceptions=True
+    )
+    assert all(isinstance(result, ConnectionError) for result in results)
+    assert group.calls == 1
+
+
+async def test_unchanged_write_is_skipped(
+    hass: HomeAssistant, server: StubServer, setup_entry
+) -> None:
+    """Writing the value the display reported sends nothing."""
+    device = hass.data[DOMAIN][setup_entry.entry_id]
+    await device.async_set_brightness(0.5)
+    await device.async_mute_volume("off")
+    await hass.async_block_till_done()
+
+    assert server.count("/set") == 0
+    assert device.dedup_stats["skipped_writes"] == 2
+
+
+async def test_failed_write_is_retried(
+    hass: HomeAssistant, server: StubServer, setup_entry
+) -> None:
+    """Retrying a value whose write failed is sent again."""
+    device = hass.data[DOMAIN][setup_entry.entry_id]
+    server.status = 503
+    await device.async_set_brightness(0.8)
+    await hass.async_block_till_done()
+    assert server.count("/set", feature="brightness") == 1
+    assert server.state[DISPLAY]["brightness"] == "0.5"
+
+    server.status = None
+    await device.async_set_brightness(0.8)
+    await hass.async_block_till_done()
+    assert server.count("/set", feature="brightness") == 2
+    assert server.state[DISPLAY]["brightness"] == "0.8"
+    await hass.config_entries.async_unload(setup_entry.entry_id)
+
+
+async def test_concurrent_reads_share_one_request(
+    hass: HomeAssistant, server: StubServer, setup_entry
+) -> None:
+    """A refresh and an on-demand read of the same feature share a request."""
+    device = hass.data[DOMAIN][setup_entry.entry_id]
+    server.latency = 0.05
+    server.requests.clear()
+
+    await asyncio.gather(
+        device.async_refresh_feature("source"), device.async_refresh_feature("source")
+    )
+    assert server.count("/get", vcp="inputSelect") == 1
+
+
+async def test_unread_value_is_not_confirmed(
+    hass: HomeAssistant, server: StubServer, config_entry
+) -> None:
+    """A value the host did not return is not treated as current."""
+    del server.state[DISPLAY]["brightness"]
+    config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    device = hass.data[DOMAIN][config_entry.entry_id]
+    assert device.state.brightness == 0.5
+    assert device.state.fetched_at("brightness") is None
+
+    await device.async_set_brightness(0.5)
+    await hass.async_block_till_done()
+    assert server.count("/set", feature="brightness") == 1
+    assert device.dedup_stats["skipped_writes"] == 0
+    await hass.config_entries.async_unload(config_entry.entry_id)
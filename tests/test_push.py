@@ -0,0 +1,40 @@
+"""Tests for the push webhook."""
+from __future__ import annotations
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.hass_better_display.const import CONF_WEBHOOK_ID
+
+from .conftest import StubServer
+
+
+async def test_push_updates_entities(
+    hass: HomeAssistant, hass_client_no_auth, server: StubServer, setup_entry
+) -> None:
+    """A push from the host updates the entities without polling."""
+    client = await hass_client_no_auth()
+    webhook_id = setup_entry.data[CONF_WEBHOOK_ID]
+    requests = len(server.requests)
+
+    response = await client.post(
+        f"/api/webhook/{webhook_id}", json={"brightness": 0.2, "mute": True}
+    )
+    assert response.status == 200
+    await hass.async_block_till_done()
+
+    assert hass.states.get("light.studio_brightness").attributes["brightness"] == 51
+    assert len(server.requests) == requests
+
+
+async def test_push_rejects_unknown_values(
+    hass: HomeAssistant, hass_client_no_auth, server: StubServer, setup_entry
+) -> None:
+    """A push without any valid feature is refused and changes nothing."""
+    client = await hass_client_no_auth()
+    webhook_id = setup_entry.data[CONF_WEBHOOK_ID]
+
+    response = await client.post(
+        f"/api/webhook/{webhook_id}", json={"brightness": "bright", "color": 3}
+    )
+    assert response.status == 400
+    assert hass.states.get("light.studio_brightness").attributes["brightness"] == 127
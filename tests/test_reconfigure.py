@@ -0,0 +1,80 @@
+"""Tests for renaming and moving a display without reloading."""
+from __future__ import annotations
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+
+from custom_components.hass_better_display.const import (
+    CONF_BASE_URL,
+    CONF_DEVICE_NAME,
+    CONF_WEBHOOK_ID,
+    DATA_HUBS,
+    DOMAIN,
+)
+
+from .conftest import StubServer
+
+
+def _registry_ids(hass: HomeAssistant, entry_id: str) -> tuple[list, dict[str, str]]:
+    devices = dr.async_entries_for_config_entry(dr.async_get(hass), entry_id)
+    entities = er.async_entries_for_config_entry(er.async_get(hass), entry_id)
+    return (
+        [device.identifiers for device in devices],
+        {entity.entity_id: entity.unique_id for entity in entities},
+    )
+
+
+async def test_rename_migrates_registries(
+    hass: HomeAssistant, server: StubServer, setup_entry
+) -> None:
+    """A renamed display keeps its device and entities, also after a reload."""
+    server.state["Sidecar"]["brightness"] = "0.2"
+    _, before = _registry_ids(hass, setup_entry.entry_id)
+
+    hass.config_entries.async_update_entry(
+        setup_entry, data={**setup_entry.data, CONF_DEVICE_NAME: "Sidecar"}
+    )
+    await hass.async_block_till_done()
+
+    devices, entities = _registry_ids(hass, setup_entry.entry_id)
+    assert devices == [{(DOMAIN, "Sidecar")}]
+    assert entities.keys() == before.keys()
+    assert all("Sidecar" in unique_id for unique_id in entities.values())
+    assert hass.states.get("light.studio_brightness").attributes["brightness"] == 51
+    assert hass.states.get("light.studio_brightness").name == "Sidecar Brightness"
+    webhook_id = setup_entry.data[CONF_WEBHOOK_ID]
+    assert hass.data["webhook"][webhook_id]["name"] == f"{DOMAIN} Sidecar"
+
+    assert await hass.config_entries.async_reload(setup_entry.entry_id)
+    await hass.async_block_till_done()
+    assert _registry_ids(hass, setup_entry.entry_id) == (devices, entities)
+    assert len(dr.async_get(hass).devices) == 1
+
+
+async def test_move_to_another_host(
+    hass: HomeAssistant, server: StubServer, setup_entry
+) -> None:
+    """A display moved to another host keeps its hub, coordinator and entities."""
+    other = StubServer(["Studio"])
+    await other.async_start()
+    try:
+        other.state["Studio"]["brightness"] = "1.0"
+        device = hass.data[DOMAIN][setup_entry.entry_id]
+        hub = device.hub
+
+        hass.config_entries.async_update_entry(
+            setup_entry, data={**setup_entry.data, CONF_BASE_URL: other.base_url}
+        )
+        await hass.async_block_till_done()
+
+        # 主机上只有这一个显示器，hub 原地迁移
+        assert device.hub is hub
+        assert hub.base_url == other.base_url
+        assert list(hass.data[DOMAIN][DATA_HUBS]) == [other.base_url]
+        assert hass.states.get("light.studio_brightness").attributes["brightness"] == 255
+        assert other.count("/get", name="Studio") > 0
+        device_entry = dr.async_get(hass).async_get_device(identifiers={(DOMAIN, "Studio")})
+        assert device_entry.configuration_url == other.base_url
+        assert await hass.config_entries.async_unload(setup_entry.entry_id)
+    finally:
+        await other.async_stop()
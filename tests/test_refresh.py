@@ -0,0 +1,40 @@
+"""Tests for the refresh cycle of a BetterDisplay host."""
+from __future__ import annotations
+
+import time
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.hass_better_display.const import DOMAIN
+
+from .conftest import DISPLAY, StubServer
+
+
+async def test_setup_reads_all_features(hass: HomeAssistant, server: StubServer, setup_entry) -> None:
+    """The first refresh fills every entity from the host."""
+    assert hass.states.get("light.studio_brightness").attributes["brightness"] == 127
+    assert hass.states.get("select.studio_input_source").state is not None
+    device = hass.data[DOMAIN][setup_entry.entry_id]
+    assert device.state.brightness == 0.5
+    assert device.state.source == "15"
+
+
+async def test_features_are_fetched_concurrently(
+    hass: HomeAssistant, server: StubServer, setup_entry
+) -> None:
+    """A refresh costs about one round trip instead of one per feature."""
+    device = hass.data[DOMAIN][setup_entry.entry_id]
+    device.hub.batch_get = False
+    server.latency = 0.2
+    server.max_in_flight = 0
+    server.requests.clear()
+
+    start = time.monotonic()
+    await device.hub.coordinator.async_refresh()
+    elapsed = time.monotonic() - start
+
+    assert device.hub.coordinator.last_update_success
+    # 输入源仍在缓存期内，其余三个功能各自一次请求，顺序读取至少需要 0.6 秒
+    assert server.count("/get", name=DISPLAY) == 3
+    assert server.max_in_flight == 3
+    assert elapsed < 2 * server.latency
@@ -0,0 +1,68 @@
+"""Tests for the refresh scheduler."""
+from __future__ import annotations
+
+import asyncio
+
+from custom_components.hass_better_display.scheduler import AdaptiveInterval, RefreshScheduler
+
+
+def test_hosts_get_distinct_phases() -> None:
+    """Each host gets its own phase and a freed slot is reused."""
+    scheduler = RefreshScheduler(16, 4)
+    for host in ("a", "b", "c"):
+        scheduler.async_register(host)
+    phases = [scheduler.phase(host) for host in ("a", "b", "c")]
+    assert phases[0] == 0
+    assert len(set(phases)) == 3
+
+    scheduler.async_unregister("b")
+    scheduler.async_register("d")
+    assert scheduler.phase("d") == phases[1]
+
+
+def test_next_interval_lands_on_phase() -> None:
+    """The delay ends on the phase of the host and is never much shorter."""
+    scheduler = RefreshScheduler(16, 4)
+    scheduler.async_register("a")
+    scheduler.async_register("b")
+    offset = scheduler.phase("b") * 10
+
+    for now in (0.0, 3.3, 17.9, 1234.5):
+        delay = scheduler.next_interval("b", 10, now).total_seconds()
+        assert delay >= 5
+        assert round((now + delay - offset) / 10, 6) % 1 == 0
+
+
+def test_adaptive_interval_backs_off_and_resets() -> None:
+    """Unchanged refreshes double the interval up to the maximum."""
+    interval = AdaptiveInterval(10, 60)
+    for expected in (20, 40, 60, 60):
+        interval.async_unchanged()
+        assert interval.current == expected
+    interval.async_activity()
+    assert interval.current == 10
+
+
+async def test_slots_bound_concurrency() -> None:
+    """Requests are limited per host and across all hosts."""
+    scheduler = RefreshScheduler(3, 2)
+    scheduler.async_register("a")
+    scheduler.async_register("b")
+    peak = {"a": 0, "b": 0, "all": 0}
+    running = {"a": 0, "b": 0}
+
+    async def request(host: str) -> None:
+        async with scheduler.async_slot(host):
+            running[host] += 1
+            peak[host] = max(peak[host], running[host])
+            peak["all"] = max(peak["all"], scheduler.in_flight)
+            await asyncio.sleep(0.01)
+            running[host] -= 1
+
+    await asyncio.gather(*(request(host) for host in "aaaaabbbbb"))
+
+    assert peak == {"a": 2, "b": 2, "all": 3}
+    assert scheduler.in_flight == 0
+    assert scheduler.waiting == 0
+    assert scheduler.max_waiting > 0
+    assert scheduler.as_dict()["lag"]["count"] == 10
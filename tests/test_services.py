@@ -0,0 +1,106 @@
+"""Tests for the set_displays service."""
+from __future__ import annotations
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+
+from custom_components.hass_better_display.breaker import STATE_OPEN
+from custom_components.hass_better_display.const import DOMAIN, SERVICE_SET_DISPLAYS
+
+from .conftest import StubServer, mock_entry
+
+
+@pytest.fixture
+async def other_server(socket_enabled):
+    """Start a second BetterDisplay host."""
+    stub = StubServer(["Office"])
+    await stub.async_start()
+    yield stub
+    await stub.async_stop()
+
+
+@pytest.fixture
+async def devices(hass: HomeAssistant, server: StubServer, other_server: StubServer):
+    """Set up two displays on one host and one on another."""
+    entries = [
+        mock_entry(server, "Studio"),
+        mock_entry(server, "Sidecar"),
+        mock_entry(other_server, "Office"),
+    ]
+    for entry in entries:
+        entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    yield {entry.title: hass.data[DOMAIN][entry.entry_id] for entry in entries}
+    for entry in entries:
+        await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_set_displays_fans_out_per_host(
+    hass: HomeAssistant, server: StubServer, other_server: StubServer, devices
+) -> None:
+    """Each display gets its result and each host is refreshed once."""
+    hubs = {device.hub for device in devices.values()}
+    assert len(hubs) == 2
+    refreshes = {hub: hub.client.timings.refresh.count for hub in hubs}
+    server.requests.clear()
+    other_server.requests.clear()
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SET_DISPLAYS,
+        {"displays": ["Studio", "Sidecar", "Office", "Nope"], "brightness": 30, "mute": True},
+        blocking=True,
+        return_response=True,
+    )
+
+    results = response["displays"]
+    assert results["Nope"] == {"success": False, "error": "unknown display"}
+    for name in ("Studio", "Sidecar", "Office"):
+        assert results[name]["success"]
+        assert sorted(results[name]["written"]) == ["brightness", "mute"]
+        assert results[name]["failed"] == []
+    assert server.count("/set") == 4
+    assert other_server.count("/set") == 2
+    assert server.state["Sidecar"]["brightness"] == "0.3"
+    assert other_server.state["Office"]["mute"] == "on"
+    assert {hub: hub.client.timings.refresh.count - refreshes[hub] for hub in hubs} == {
+        hub: 1 for hub in hubs
+    }
+    assert devices["Office"].state.brightness == 0.3
+
+
+async def test_set_displays_reports_unreachable_host(
+    hass: HomeAssistant, server: StubServer, other_server: StubServer, devices
+) -> None:
+    """A display whose host is down fails alone."""
+    devices["Office"].hub.client.breaker.state = STATE_OPEN
+    other_server.requests.clear()
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SET_DISPLAYS,
+        {"displays": ["Studio", "Office"], "volume": 20},
+        blocking=True,
+        return_response=True,
+    )
+
+    results = response["displays"]
+    assert results["Studio"]["success"]
+    assert not results["Office"]["success"]
+    assert "unreachable" in results["Office"]["error"]
+    assert other_server.count("/set") == 0
+
+
+async def test_set_displays_without_known_display(hass: HomeAssistant, devices) -> None:
+    """Naming no configured display is a validation error."""
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_SET_DISPLAYS,
+            {"displays": ["Nope"], "brightness": 10},
+            blocking=True,
+            return_response=True,
+        )
@@ -0,0 +1,58 @@
+"""Tests for the display state snapshot."""
+from __future__ import annotations
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.hass_better_display.const import DOMAIN
+from custom_components.hass_better_display.state import DisplayState
+
+from .conftest import DISPLAY, StubServer
+
+
+def test_updated_replaces_only_given_fields() -> None:
+    """updated() returns a new snapshot and leaves the original untouched."""
+    state = DisplayState(0.5, 0.5, "off", "15", 1.0, 1.0, 1.0, 1.0)
+    new = state.updated({"brightness": 0.8, "brightness_fetched_at": None})
+
+    assert new is not state
+    assert new.brightness == 0.8
+    assert new.fetched_at("brightness") is None
+    assert new.volume_fetched_at == 1.0
+    assert (new.volume, new.mute_state, new.source) == (0.5, "off", "15")
+    assert state.brightness == 0.5
+
+
+def test_fetch_times_do_not_affect_equality() -> None:
+    """An unchanged refresh compares equal even though it was read later."""
+    state = DisplayState(0.5, 0.5, "off", "15", 1.0, 1.0, 1.0, 1.0)
+    assert state.updated({"brightness_fetched_at": 2.0}) == state
+    assert state.updated({"mute_state": "on"}) != state
+
+
+def test_dict_round_trip() -> None:
+    """Stored values restore the same snapshot, without fetch times."""
+    state = DisplayState(0.3, 0.7, "on", "17", 1.0, 1.0, 1.0, 1.0)
+    restored = DisplayState.from_dict(state.as_dict())
+    assert restored == state
+    assert not restored.fetched
+
+
+async def test_device_state_is_the_published_snapshot(
+    hass: HomeAssistant, server: StubServer, setup_entry
+) -> None:
+    """Every change goes through the coordinator, so there is one copy."""
+    device = hass.data[DOMAIN][setup_entry.entry_id]
+    coordinator = device.hub.coordinator
+    assert device.state is coordinator.data[DISPLAY]
+
+    await device.async_write_values({"brightness": 0.3, "mute": "on"})
+    published = coordinator.data[DISPLAY]
+    assert device.state is published
+    assert (published.brightness, published.mute_state) == (0.3, "on")
+    assert hass.states.get("light.studio_brightness").attributes["brightness"] == 76
+
+    # 刷新失败时不改变已发布的快照
+    await server.async_stop()
+    await coordinator.async_refresh()
+    assert not coordinator.last_update_success
+    assert device.state is published
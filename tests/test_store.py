@@ -0,0 +1,64 @@
+"""Tests for restoring the last known state at startup."""
+from __future__ import annotations
+
+import asyncio
+import time
+
+from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.core import HomeAssistant
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.hass_better_display.const import DOMAIN, STORE_VERSION
+
+from .conftest import StubServer
+
+
+def _seed(hass_storage: dict, state: dict) -> None:
+    hass_storage[f"{DOMAIN}.state"] = {
+        "version": STORE_VERSION,
+        "minor_version": 1,
+        "key": f"{DOMAIN}.state",
+        "data": {f"{DOMAIN}_Studio": state},
+    }
+
+
+async def test_restored_state_shows_before_first_poll(
+    hass: HomeAssistant, hass_storage: dict, server: StubServer, config_entry: MockConfigEntry
+) -> None:
+    """A saved state is shown at once and setup does not wait for a slow host."""
+    _seed(hass_storage, {"brightness": 0.2, "volume": 0.4, "mute_state": "on", "source": "17"})
+    server.latency = 1.0
+
+    config_entry.add_to_hass(hass)
+    start = time.monotonic()
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert time.monotonic() - start < server.latency
+
+    device = hass.data[DOMAIN][config_entry.entry_id]
+    assert device.available
+    assert not device.fetched
+    light = hass.states.get("light.studio_brightness")
+    assert light.state == "on"
+    assert light.attributes["brightness"] == 51
+    assert device.state.source == "17"
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    # 让桩服务器处理完被取消的首次刷新
+    await asyncio.sleep(server.latency)
+
+
+async def test_invalid_saved_state_is_ignored(
+    hass: HomeAssistant, hass_storage: dict, server: StubServer, config_entry: MockConfigEntry
+) -> None:
+    """A broken payload is skipped and the display waits for the host."""
+    _seed(hass_storage, {"brightness": "bright"})
+    await server.async_stop()
+
+    config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert not hass.data[DOMAIN][config_entry.entry_id].available
+    assert hass.states.get("light.studio_brightness").state == STATE_UNAVAILABLE
@@ -0,0 +1,53 @@
+"""Tests for publishing local state after writes and pushes."""
+from __future__ import annotations
+
+from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.core import HomeAssistant
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.hass_better_display.const import CONF_VERIFY_DELAY, DOMAIN
+
+from .conftest import StubServer
+
+
+async def test_failed_verify_keeps_entities_unavailable(
+    hass: HomeAssistant, server: StubServer, config_entry: MockConfigEntry
+) -> None:
+    """A write after a failed poll does not make an unreachable host look fine."""
+    hass.config_entries.async_update_entry(config_entry, options={CONF_VERIFY_DELAY: 0})
+    config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    device = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator = device.hub.coordinator
+
+    server.drop_reads = True
+    await coordinator.async_refresh()
+    assert not coordinator.last_update_success
+
+    await device.async_mute_volume("on")
+    await hass.async_block_till_done()
+    assert server.count("/set", feature="mute") == 1
+    assert not coordinator.last_update_success
+    assert hass.states.get("light.studio_brightness").state == STATE_UNAVAILABLE
+    await hass.config_entries.async_unload(config_entry.entry_id)
+
+
+async def test_push_does_not_reset_back_off(
+    hass: HomeAssistant, server: StubServer, setup_entry
+) -> None:
+    """Only user commands put the host back on the fastest interval."""
+    hub = hass.data[DOMAIN][setup_entry.entry_id].hub
+    device = hass.data[DOMAIN][setup_entry.entry_id]
+    await hub.coordinator.async_refresh()
+    backed_off = hub.interval.current
+    assert backed_off > hub.interval.minimum
+
+    assert device.async_handle_push({"brightness": 0.3})
+    assert hub.interval.current == backed_off
+
+    await device.async_set_brightness(0.6)
+    await hass.async_block_till_done()
+    assert hub.interval.current == hub.interval.minimum
+    await hass.config_entries.async_unload(setup_entry.entry_id)
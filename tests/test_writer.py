@@ -0,0 +1,108 @@
+"""Tests for the coalescing writer and transitions."""
+from __future__ import annotations
+
+import asyncio
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.hass_better_display.const import DOMAIN
+from custom_components.hass_better_display.writer import CoalescingWriter, TransitionRamp
+
+from .conftest import DISPLAY, StubServer
+
+
+async def test_writer_sends_only_latest_value(hass: HomeAssistant) -> None:
+    """Values submitted while a request is in flight collapse into the last one."""
+    sent = []
+    release = asyncio.Event()
+    settled = asyncio.Event()
+
+    async def send(value):
+        sent.append(value)
+        await release.wait()
+        return True
+
+    async def on_settled():
+        settled.set()
+
+    writer = CoalescingWriter(hass, "test", send, on_settled)
+    for value in (0.1, 0.2, 0.3, 0.4):
+        writer.async_submit(value)
+        await asyncio.sleep(0)
+    assert writer.busy
+    release.set()
+    await settled.wait()
+
+    assert sent == [0.1, 0.4]
+    assert not writer.busy
+
+
+async def test_writer_cancel_drops_pending_value(hass: HomeAssistant) -> None:
+    """Cancelling waits for the request in flight and drops the queued value."""
+    sent = []
+    release = asyncio.Event()
+
+    async def send(value):
+        sent.append(value)
+        await release.wait()
+        return True
+
+    async def on_settled():
+        pass
+
+    writer = CoalescingWriter(hass, "test", send, on_settled)
+    writer.async_submit(0.1)
+    await asyncio.sleep(0)
+    writer.async_submit(0.2)
+    cancel = asyncio.ensure_future(writer.async_cancel())
+    await asyncio.sleep(0)
+    assert not cancel.done()
+    release.set()
+    await cancel
+
+    assert sent == [0.1]
+    assert not writer.busy
+
+
+async def test_ramp_steps_and_cancel(hass: HomeAssistant) -> None:
+    """A transition submits rate-limited steps and stops when cancelled."""
+    submitted = []
+    ramp = TransitionRamp(hass, "test", submitted.append, 20, 0.01)
+
+    ramp.async_start(0.0, 0.5, 0.1)
+    await asyncio.sleep(0.2)
+    assert not ramp.running
+    assert submitted[-1] == 0.5
+    assert len(submitted) == 2
+
+    submitted.clear()
+    ramp.async_start(0.0, 1.0, 1.0)
+    await asyncio.sleep(0.1)
+    ramp.async_cancel()
+    count = len(submitted)
+    await asyncio.sleep(0.1)
+    assert not ramp.running
+    assert 0 < count == len(submitted)
+
+
+async def test_bulk_write_overrides_transition(
+    hass: HomeAssistant, server: StubServer, setup_entry
+) -> None:
+    """A bulk write stops a running transition and its queued values."""
+    device = hass.data[DOMAIN][setup_entry.entry_id]
+    server.latency = 0.05
+
+    await device.async_set_brightness(0.9, transition=0.5)
+    await asyncio.sleep(0.15)
+    assert await device.async_write_values({"brightness": 0.2}) == {"brightness": True}
+    await asyncio.sleep(0.6)
+
+    writes = [
+        request["value"]
+        for request in server.requests
+        if request["path"] == "/set" and request.get("feature") == "brightness"
+    ]
+    assert writes[-1] == "0.2"
+    assert server.state[DISPLAY]["brightness"] == "0.2"
+    assert device.state.brightness == 0.2
+    await hass.config_entries.async_unload(setup_entry.entry_id)